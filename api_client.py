@@ -1,8 +1,139 @@
 import json
+import math
+import os
+import re
+import threading
+import time
 import requests
-from typing import Dict, List, Tuple, Optional
-from decimal import Decimal
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple, Optional
 import urllib3
+from urllib3.util.retry import Retry
+
+# orjson is optional; it parses the large /models payload several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# Model ID substrings that mark non-chat models
+EXCLUDED_MODEL_TYPES = ("embedding", "rerank", "moderation", "image", "audio", "llama-guard")
+
+# Case-insensitive search avoids a lowercased copy of every modality string
+_TEXT_MODALITY_RE = re.compile(r"text", re.IGNORECASE)
+
+
+def _price_micros(value) -> int:
+    """
+    Convert an OpenRouter per-token price to integer micro-dollars per million tokens.
+    Plain decimal strings are scaled by shifting digits, avoiding a float round trip;
+    exponent notation and numbers fall back to float. Unparseable or non-finite
+    prices (e.g. "nan", "inf") count as 0 so one bad entry cannot fail the catalog.
+    """
+    if not value:
+        return 0
+    
+    if isinstance(value, str) and "e" not in value.lower():
+        text = value.strip()
+        negative = text.startswith("-")
+        whole, _, frac = text.lstrip("+-").partition(".")
+        if (whole or frac) and (not whole or whole.isdecimal()) and (not frac or frac.isdecimal()):
+            # 10**12 scale: 10**6 for per-million, 10**6 for micro-dollars; 13th digit rounds
+            frac = frac.ljust(13, "0")
+            micros = int(whole or "0") * 10**12 + int(frac[:12]) + (frac[12] >= "5")
+            return -micros if negative else micros
+    
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return 0
+    return round(number * 10**12) if math.isfinite(number) else 0
+
+
+def _format_micros(micros: int) -> str:
+    """
+    Format micro-dollars as a dollar amount rounded to cents, e.g. '$2.50'.
+    Halves round to even, as the previous f"{price:.2f}" formatting did.
+    """
+    cents, remainder = divmod(micros, 10_000)
+    if remainder > 5_000 or (remainder == 5_000 and cents % 2):
+        cents += 1
+    return f"${cents // 100}.{cents % 100:02d}"
+
+
+class _ChatSafeRetry(Retry):
+    """Retry that only re-sends a POST on 429.
+    
+    A 5xx from a gateway can arrive after the chat request was already run
+    and billed, so only a rate-limit rejection is safe to repeat for POST.
+    """
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST" and status_code != 429:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _slim_model(model: Dict) -> Dict:
+    """Keep only the catalog fields list_models reads, dropping bulky provider metadata."""
+    architecture = model.get("architecture") or {}
+    pricing = model.get("pricing") or {}
+    slim = {key: model[key] for key in ("id", "name", "description", "context_length") if key in model}
+    if architecture.get("modality"):
+        slim["architecture"] = {"modality": architecture["modality"]}
+    slim["pricing"] = {key: pricing[key] for key in ("prompt", "completion", "image") if key in pricing}
+    return slim
+
+
+@lru_cache(maxsize=256)
+def format_context_length(context_length: int) -> str:
+    """Format a context window size as e.g. '512', '128K' or '1.0M' (memoized, sizes repeat a lot)."""
+    if context_length >= 1_000_000:
+        return f"{context_length/1_000_000:.1f}M"
+    elif context_length >= 1_000:
+        return f"{context_length/1_000:.0f}K"
+    return f"{context_length}"
+
+
+class OpenRouterError(RuntimeError):
+    """Base class for errors raised by OpenRouterClient."""
+
+
+class OpenRouterTimeout(OpenRouterError):
+    """Request did not complete within its timeout."""
+
+
+class OpenRouterConnError(OpenRouterError):
+    """Connection to the API (or proxy) failed after retries."""
+
+
+class OpenRouterHTTPError(OpenRouterError):
+    """API answered with a non-2xx status."""
+    
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _with_context(error: OpenRouterError, context: str) -> OpenRouterError:
+    """Return an error of the same type (and status) with context prefixed to its message."""
+    if isinstance(error, OpenRouterHTTPError):
+        return OpenRouterHTTPError(f"{context}: {error}", error.status_code)
+    return type(error)(f"{context}: {error}")
+
 
 # Suppress SSL warnings when using proxy without verification
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -13,16 +144,87 @@ class OpenRouterClient:
     
     BASE_URL = "https://openrouter.ai/api/v1"
     
+    # On-disk cache for the /models catalog
+    DEFAULT_CACHE_DIR = Path.home() / ".openrouter_tester" / "cache"
+    DEFAULT_MODELS_TTL = 24 * 60 * 60  # seconds
+    
+    # (parameter, lower, upper) clamps applied to chat sampling values
+    _SAMPLING_BOUNDS = (
+        ("temperature", 0.0, 2.0),
+        ("top_p", 0.0, 1.0),
+        ("top_k", 1, float("inf")),
+        ("max_tokens", 1, float("inf")),
+    )
+    
+    # Single regex scan instead of one substring test per excluded type
+    _EXCLUDED_RE = re.compile("|".join(map(re.escape, EXCLUDED_MODEL_TYPES)), re.IGNORECASE)
+    
     def __init__(self, api_key: str, proxy_url: Optional[str] = None, 
                  verify_ssl: bool = True, referer: str = "https://example.com",
-                 app_title: str = "OpenRouterTester"):
+                 app_title: str = "OpenRouterTester",
+                 ttl_seconds: int = DEFAULT_MODELS_TTL,
+                 cache_dir: Optional[str] = None,
+                 max_connections: int = 20,
+                 key_info_ttl: float = 30.0):
         self.api_key = api_key
         self.proxy_url = proxy_url
         self.verify_ssl = verify_ssl
         self.referer = referer
         self.app_title = app_title
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = Path(cache_dir) if cache_dir else self.DEFAULT_CACHE_DIR
+        self.max_connections = max(1, max_connections)
+        self.key_info_ttl = key_info_ttl
+        self._key_info_cache: Optional[Tuple[float, Dict]] = None
         
-    def _get_headers(self) -> Dict[str, str]:
+        # Inputs are fixed after construction, so build headers/proxies once
+        self._headers_cached = self._build_headers()
+        self._proxies_cached = self._build_proxies()
+        
+        # Persistent session so repeated calls reuse the pooled TLS connection
+        self._session = requests.Session()
+        self._session.headers.update(self._headers_cached)
+        self._session.verify = verify_ssl
+        self._session.proxies = self._proxies_cached or {}
+        
+        # Retry transient failures inside the pool, reusing the live connection.
+        # Read errors are not retried (read=False re-raises the original
+        # ReadTimeout): a timed-out chat may already be billed, and each attempt
+        # could wait the full timeout again.
+        retry = _ChatSafeRetry(
+            total=4,
+            connect=3,
+            read=False,
+            status=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(("GET", "POST")),
+            respect_retry_after_header=True,
+            raise_on_status=False  # Surface the last response through raise_for_status()
+        )
+        
+        # Blocking pool: concurrent callers wait for a kept-alive connection
+        # instead of opening throwaway ones past max_connections
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.max_connections,
+            pool_block=True,
+            max_retries=retry
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+    
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        
+    def _build_headers(self) -> Dict[str, str]:
         """Build common headers for API requests."""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -37,7 +239,7 @@ class OpenRouterClient:
             
         return headers
     
-    def _get_proxies(self) -> Optional[Dict[str, str]]:
+    def _build_proxies(self) -> Optional[Dict[str, str]]:
         """Build proxy configuration if enabled."""
         if self.proxy_url:
             return {
@@ -46,161 +248,249 @@ class OpenRouterClient:
             }
         return None
     
+    def _get_headers(self) -> Dict[str, str]:
+        """Return the common headers built at construction."""
+        return self._headers_cached
+    
+    def _get_proxies(self) -> Optional[Dict[str, str]]:
+        """Return the proxy configuration built at construction."""
+        return self._proxies_cached
+    
     def _make_request(self, method: str, endpoint: str, 
                       data: Optional[Dict] = None, timeout: int = 30) -> Dict:
         """Make HTTP request with error handling."""
         url = f"{self.BASE_URL}{endpoint}"
-        headers = self._get_headers()
-        proxies = self._get_proxies()
         
         try:
             if method.upper() == "GET":
-                response = requests.get(
-                    url, 
-                    headers=headers, 
-                    proxies=proxies, 
-                    verify=self.verify_ssl,
-                    timeout=timeout
-                )
+                # Stream so the (large) /models body is read once as bytes, never as text
+                response = self._session.get(url, timeout=timeout, stream=True)
             elif method.upper() == "POST":
-                response = requests.post(
-                    url,
-                    headers=headers,
-                    json=data,
-                    proxies=proxies,
-                    verify=self.verify_ssl,
-                    timeout=timeout
-                )
+                # Body is pre-encoded; Content-Type is already set on the session
+                response = self._session.post(url, data=_json_dumps(data), timeout=timeout)
             else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+                raise OpenRouterError(f"Unsupported HTTP method: {method}")
+            
+            try:
+                raw = response.content
+            finally:
+                # Hand the connection back to the pool as soon as the body is read
+                response.close()
             
             response.raise_for_status()
-            return response.json()
+            return _json_loads(raw)
             
-        except requests.exceptions.Timeout:
-            raise Exception(f"Request timed out after {timeout} seconds")
+        # Connection and status failures only reach here once the retry budget is spent
+        except requests.exceptions.Timeout as e:
+            raise OpenRouterTimeout(f"Request timed out after {timeout} seconds") from e
         except requests.exceptions.ConnectionError as e:
-            raise Exception(f"Connection error: {str(e)}")
+            # requests reports a stall while reading the body as ConnectionError
+            if isinstance(e.args[0] if e.args else None, urllib3.exceptions.ReadTimeoutError):
+                raise OpenRouterTimeout(f"Request timed out after {timeout} seconds") from e
+            raise OpenRouterConnError(f"Connection error: {str(e)}") from e
         except requests.exceptions.HTTPError as e:
-            raise Exception(f"HTTP error {response.status_code}: {response.text}")
-        except json.JSONDecodeError:
-            raise Exception("Invalid JSON response from server")
-        except Exception as e:
-            raise Exception(f"Request failed: {str(e)}")
+            # Bound the work and message size; error bodies can be large HTML pages
+            body = raw[:512].decode("utf-8", "replace") if raw else ""
+            raise OpenRouterHTTPError(f"HTTP error {response.status_code}: {body}",
+                                      response.status_code) from e
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
+            raise OpenRouterError("Invalid JSON response from server") from e
+        except requests.exceptions.RequestException as e:
+            raise OpenRouterError(f"Request failed: {str(e)}") from e
     
     def get_key_info(self) -> Dict:
         """
         Get API key information including limits and usage.
+        Repeated calls within key_info_ttl seconds reuse the last response.
         Returns: Dictionary with key details
         """
+        cache = self._key_info_cache
+        if cache and time.monotonic() - cache[0] < self.key_info_ttl:
+            return cache[1]
+        
         try:
             response = self._make_request("GET", "/auth/key")
             data = response.get("data", {})
+            self._key_info_cache = (time.monotonic(), data)
             return data
             
+        except OpenRouterError as e:
+            raise _with_context(e, "Failed to fetch key info") from e
         except Exception as e:
-            raise Exception(f"Failed to fetch key info: {str(e)}")
+            raise OpenRouterError(f"Failed to fetch key info: {str(e)}") from e
+    
+    def invalidate_key_info(self):
+        """Drop the cached key info so the next get_key_info() refetches it."""
+        self._key_info_cache = None
+    
+    def _read_models_cache(self, cache_file: Path) -> Optional[List[Dict]]:
+        """Read the cached /models catalog, or None if missing or unreadable."""
+        try:
+            with open(cache_file, 'rb') as f:
+                return _json_loads(f.read()).get("data", [])
+        except (OSError, ValueError, AttributeError):
+            return None
+    
+    def _write_models_cache(self, models_data: List[Dict]):
+        """Atomically store the /models catalog and mark the sync time."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = self.cache_dir / "models.json"
+            tmp_file = cache_file.with_suffix(".json.tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps({"data": models_data}))
+            os.replace(tmp_file, cache_file)
+            (self.cache_dir / ".last_sync").touch()
+        except OSError:
+            # Caching is best-effort; a read-only home dir must not break loading
+            pass
+    
+    def _get_models_data(self, force_refresh: bool = False) -> List[Dict]:
+        """
+        Get the raw /models catalog, preferring the disk cache while it is fresh.
+        Args:
+            force_refresh: If True, refetch even when the disk cache is fresh
+        Environment overrides:
+            OPENROUTER_MODELS_PATH: read the catalog from this local JSON file
+            OPENROUTER_DISABLE_REMOTE_MODELS=1: never hit the network, use cache only
+        Returns: List of raw model dicts
+        """
+        local_path = os.environ.get("OPENROUTER_MODELS_PATH")
+        if local_path:
+            models_data = self._read_models_cache(Path(local_path))
+            if models_data is None:
+                raise OpenRouterError(f"Cannot read models file: {local_path}")
+            return models_data
+        
+        cache_file = self.cache_dir / "models.json"
+        remote_disabled = os.environ.get("OPENROUTER_DISABLE_REMOTE_MODELS") == "1"
+        
+        try:
+            is_fresh = (not force_refresh and
+                        time.time() - (self.cache_dir / ".last_sync").stat().st_mtime < self.ttl_seconds)
+        except OSError:
+            is_fresh = False
+        
+        if is_fresh or remote_disabled:
+            models_data = self._read_models_cache(cache_file)
+            if models_data is not None:
+                return models_data
+            if remote_disabled:
+                raise OpenRouterError("Remote model loading is disabled and no cached catalog exists")
+        
+        try:
+            response = self._make_request("GET", "/models")
+        except (OpenRouterConnError, OpenRouterTimeout):
+            # Serve the stale copy rather than failing when offline
+            models_data = self._read_models_cache(cache_file)
+            if models_data is not None:
+                return models_data
+            raise
+        
+        # Keep (and cache) only the fields we use, not the full provider metadata
+        models_data = [_slim_model(model) for model in response.get("data", [])]
+        self._write_models_cache(models_data)
+        return models_data
+    
+    def _is_text_model(self, model_id: str, modality: str) -> bool:
+        """Return False for non-chat models by ID heuristics or a non-text modality."""
+        if self._EXCLUDED_RE.search(model_id):
+            return False
+        return not modality or _TEXT_MODALITY_RE.search(modality) is not None
     
-    def list_models(self, include_pricing: bool = False) -> List[Dict[str, str]]:
+    @staticmethod
+    def _build_model_info(model: dict, model_id: str, include_pricing: bool) -> Dict:
+        """Build the list_models() entry for one catalog model."""
+        model_info = {
+            "id": model_id,
+            "name": model.get("name", model_id),
+            "description": model.get("description", "No description available")
+        }
+        
+        # Add pricing information if requested
+        if include_pricing:
+            pricing = model.get("pricing", {})
+            context_length = model.get("context_length", 0)
+            
+            # Convert pricing to readable format (per million tokens)
+            prompt_micros = _price_micros(pricing.get("prompt"))
+            completion_micros = _price_micros(pricing.get("completion"))
+            image_micros = _price_micros(pricing.get("image"))
+            
+            # Build pricing display string
+            pricing_parts = []
+            if context_length:
+                pricing_parts.append(f"[ {format_context_length(context_length)} ctx ]")
+            
+            if prompt_micros > 0:
+                pricing_parts.append(f"\t[ {_format_micros(prompt_micros)}/M in")
+            if completion_micros > 0:
+                pricing_parts.append(f"{_format_micros(completion_micros)}/M out ]")
+            if image_micros > 0:
+                pricing_parts.append(f"[ {_format_micros(image_micros)}/M img ]")
+            
+            model_info["pricing_display"] = ", ".join(pricing_parts) if pricing_parts else "Free"
+            model_info["context_length"] = context_length
+            model_info["prompt_price"] = prompt_micros / 1_000_000
+            model_info["completion_price"] = completion_micros / 1_000_000
+            model_info["prompt_price_micros"] = prompt_micros
+            model_info["completion_price_micros"] = completion_micros
+        
+        return model_info
+    
+    def list_models(self, include_pricing: bool = False, force_refresh: bool = False) -> List[Dict[str, str]]:
         """
         Get list of available chat/text models.
         Args:
             include_pricing: If True, include pricing and capability details
+            force_refresh: If True, bypass the disk cache TTL and refetch the catalog
         Returns: List of {id, name, description, pricing, context_length} dicts
         """
         try:
-            response = self._make_request("GET", "/models")
-            models_data = response.get("data", [])
-            
-            chat_models = []
-            excluded_types = ["embedding", "rerank", "moderation", "image", "audio", "llama-guard"]
-            
-            for model in models_data:
-                model_id = model.get("id", "")
-                
-                # Filter out non-chat models by ID heuristics
-                if any(excluded in model_id.lower() for excluded in excluded_types):
-                    continue
-                
-                # Check architecture field if available
-                architecture = model.get("architecture", {})
-                if architecture:
-                    modality = architecture.get("modality", "")
-                    if modality and "text" not in modality.lower():
-                        continue
-                
-                model_info = {
-                    "id": model_id,
-                    "name": model.get("name", model_id),
-                    "description": model.get("description", "No description available")
-                }
-                
-                # Add pricing information if requested
-                if include_pricing:
-                    pricing = model.get("pricing", {})
-                    context_length = model.get("context_length", 0)
-                    
-                    # Convert pricing to readable format (per million tokens)
-                    prompt_price = float(pricing.get("prompt", 0)) * 1_000_000 if pricing.get("prompt") else 0
-                    completion_price = float(pricing.get("completion", 0)) * 1_000_000 if pricing.get("completion") else 0
-                    image_price = float(pricing.get("image", 0)) * 1_000_000 if pricing.get("image") else 0
-                    
-                    # Build pricing display string
-                    pricing_parts = []
-                    if context_length:
-                        # Format context length
-                        if context_length >= 1_000_000:
-                            pricing_parts.append(f"[ {context_length/1_000_000:.1f}M ctx ]")
-                        elif context_length >= 1_000:
-                            pricing_parts.append(f"[ {context_length/1_000:.0f}K ctx ]")
-                        else:
-                            pricing_parts.append(f"[ {context_length} ctx ]")
-                    
-                    if prompt_price > 0:
-                        pricing_parts.append(f"\t[ ${prompt_price:.2f}/M in")
-                    if completion_price > 0:
-                        pricing_parts.append(f"${completion_price:.2f}/M out ]")
-                    if image_price > 0:
-                        pricing_parts.append(f"[ ${image_price:.2f}/M img ]")
-                    
-                    model_info["pricing_display"] = ", ".join(pricing_parts) if pricing_parts else "Free"
-                    model_info["context_length"] = context_length
-                    model_info["prompt_price"] = prompt_price
-                    model_info["completion_price"] = completion_price
-                
-                chat_models.append(model_info)
-            
-            return sorted(chat_models, key=lambda x: x["id"])
+            models_data = self._get_models_data(force_refresh)
+            
+            # Pass 1: pull out just the fields the filter needs
+            ids = [model.get("id", "") for model in models_data]
+            modalities = [(model.get("architecture") or {}).get("modality", "") for model in models_data]
+            
+            # Pass 2: keep only chat/text models
+            kept = [i for i, (model_id, modality) in enumerate(zip(ids, modalities))
+                    if self._is_text_model(model_id, modality)]
+            
+            # Pass 3: build result dicts for the kept models only
+            chat_models = [self._build_model_info(models_data[i], ids[i], include_pricing) for i in kept]
             
+            chat_models.sort(key=itemgetter("id"))
+            return chat_models
+            
+        except OpenRouterError as e:
+            raise _with_context(e, "Failed to fetch models") from e
         except Exception as e:
-            raise Exception(f"Failed to fetch models: {str(e)}")
+            raise OpenRouterError(f"Failed to fetch models: {str(e)}") from e
     
-    def chat(self, model_id: str, system_prompt: str, user_prompt: str,
-             temperature: float = 0.7, top_p: float = 0.95, 
-             top_k: int = 40, max_tokens: int = 1024, 
-             enable_reasoning: bool = False) -> Tuple[str, Dict]:
+    def _build_chat_template(self, model_id: str, system_prompt: str,
+                             temperature: float = 0.7, top_p: float = 0.95,
+                             top_k: int = 40, max_tokens: int = 1024,
+                             enable_reasoning: bool = False, validate: bool = True) -> Dict:
         """
-        Send chat completion request with optional reasoning.
-        Returns: (response_text, usage_dict)
+        Build the chat payload for a model and sampling config, minus the user message.
+        Args:
+            validate: Clamp sampling values to _SAMPLING_BOUNDS; batch callers that
+                      already validated once can pass False
+        Returns: Payload dict whose "messages" holds only the optional system message
         """
-        # Validate parameters
-        temperature = max(0.0, min(2.0, temperature))
-        top_p = max(0.0, min(1.0, top_p))
-        top_k = max(1, top_k)
-        max_tokens = max(1, max_tokens)
+        sampling = {"temperature": temperature, "top_p": top_p, "top_k": top_k, "max_tokens": max_tokens}
+        if validate:
+            sampling = {name: max(low, min(high, sampling[name])) for name, low, high in self._SAMPLING_BOUNDS}
         
         messages = []
         if system_prompt and system_prompt.strip():
             messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": user_prompt})
         
         payload = {
             "model": model_id,
             "messages": messages,
-            "temperature": temperature,
-            "top_p": top_p,
-            "top_k": top_k,
-            "max_tokens": max_tokens,
+            **sampling,
             "usage": {"include": True}
         }
         
@@ -208,13 +498,23 @@ class OpenRouterClient:
         if enable_reasoning:
             payload["reasoning"] = {"enabled": True}
         
+        return payload
+    
+    def _send_chat(self, payload: Dict) -> Tuple[str, Dict]:
+        """
+        POST a complete chat payload and unpack the reply.
+        Returns: (response_text, usage_dict)
+        """
         try:
             response = self._make_request("POST", "/chat/completions", data=payload, timeout=120)
             
+            # The request may have spent credit, so cached key usage is now stale
+            self.invalidate_key_info()
+            
             # Extract response text
             choices = response.get("choices", [])
             if not choices:
-                raise Exception("No response choices returned")
+                raise OpenRouterError("No response choices returned")
             
             message = choices[0].get("message", {})
             content = message.get("content", "")
@@ -224,6 +524,102 @@ class OpenRouterClient:
             
             return content, usage
             
+        except OpenRouterError as e:
+            raise _with_context(e, "Chat request failed") from e
         except Exception as e:
-            raise Exception(f"Chat request failed: {str(e)}")
-
+            raise OpenRouterError(f"Chat request failed: {str(e)}") from e
+    
+    def chat(self, model_id: str, system_prompt: str, user_prompt: str,
+             temperature: float = 0.7, top_p: float = 0.95, 
+             top_k: int = 40, max_tokens: int = 1024, 
+             enable_reasoning: bool = False, validate: bool = True) -> Tuple[str, Dict]:
+        """
+        Send chat completion request with optional reasoning.
+        Returns: (response_text, usage_dict)
+        """
+        payload = self._build_chat_template(model_id, system_prompt, temperature, top_p,
+                                            top_k, max_tokens, enable_reasoning, validate)
+        payload["messages"].append({"role": "user", "content": user_prompt})
+        return self._send_chat(payload)
+    
+    def bind_chat(self, model_id: str, system_prompt: str = "",
+                  **sampling) -> Callable[[str], Tuple[str, Dict]]:
+        """
+        Pre-build the payload for a fixed model and sampling config.
+        Args:
+            model_id: Model to send every prompt to
+            system_prompt: Optional system prompt shared by every call
+            **sampling: temperature, top_p, top_k, max_tokens, enable_reasoning, validate
+        Returns: Function taking a user prompt and returning (response_text, usage_dict)
+        """
+        template = self._build_chat_template(model_id, system_prompt, **sampling)
+        base_messages = template["messages"]
+        
+        def call(user_prompt: str) -> Tuple[str, Dict]:
+            # Fresh top-level dict per call so bound callers are safe to run concurrently
+            payload = dict(template)
+            payload["messages"] = base_messages + [{"role": "user", "content": user_prompt}]
+            return self._send_chat(payload)
+        
+        return call
+    
+    def chat_many(self, jobs: List[Dict], max_workers: int = 8,
+                  on_result: Optional[Callable[[int, object, float], None]] = None,
+                  executor: Optional[ThreadPoolExecutor] = None,
+                  stop_event: Optional[threading.Event] = None) -> List:
+        """
+        Send several chat completion requests concurrently over the pooled session.
+        Args:
+            jobs: List of keyword-argument dicts accepted by chat()
+            max_workers: Maximum number of requests in flight at once
+            on_result: Called as on_result(job_index, outcome, elapsed_seconds) on the
+                       calling thread as each job finishes, in completion order
+            executor: Run on this pool instead of a private one; the caller owns
+                      its shutdown (and may cancel queued jobs with it)
+            stop_event: Once set, jobs that have not been sent yet are skipped
+        Returns: List in job order of (response_text, usage_dict) tuples,
+                 or the Exception raised for that job
+        """
+        if not jobs:
+            return []
+        
+        def run(job: Dict):
+            start_time = time.time()
+            if stop_event is not None and stop_event.is_set():
+                return OpenRouterError("Cancelled before sending"), 0.0
+            try:
+                outcome = self.chat(**job)
+            except Exception as e:
+                outcome = e
+            return outcome, time.time() - start_time
+        
+        results = [None] * len(jobs)
+        
+        owned = executor is None
+        if owned:
+            # More workers than pooled connections would only queue on the pool
+            executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs), self.max_connections)))
+        
+        try:
+            futures = {executor.submit(run, job): index for index, job in enumerate(jobs)}
+            pending = set(futures)
+            while pending:
+                # Futures cancelled by executor.shutdown(cancel_futures=True) never wake
+                # a waiter, so poll for them once stop_event is in play
+                done, pending = wait(pending, timeout=None if stop_event is None else 0.25,
+                                     return_when=FIRST_COMPLETED)
+                cancelled = {future for future in pending if future.cancelled()}
+                pending -= cancelled
+                for future in done | cancelled:
+                    index = futures[future]
+                    try:
+                        outcome, elapsed = future.result()
+                    except Exception as e:  # Includes CancelledError for jobs cancelled in the queue
+                        outcome, elapsed = e, 0.0
+                    results[index] = outcome
+                    if on_result is not None:
+                        on_result(index, outcome, elapsed)
+        finally:
+            if owned:
+                executor.shutdown()
+        return results
@@ -9,18 +9,71 @@ os.environ['TK_SILENCE_DEPRECATION'] = '1'
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
-import time
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import json
+import re
 from decimal import Decimal
+from functools import lru_cache
 from typing import List
-from api_client import OpenRouterClient
-from logging_utils import DualLogger
+
+# orjson is optional; config files are read and written as bytes either way
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _config_loads = orjson.loads
+    
+    def _config_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    _config_loads = json.loads
+    
+    def _config_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+# Model ID substrings that mark reasoning and image-generation models
+REASONING_PATTERNS = ('o1', 'o3', 'deepthink', 'reasoning', 'deepseek-r1', 'qwq')
+IMAGE_PATTERNS = ('dalle', 'dall-e', 'stable-diffusion', 'midjourney', 'imagen',
+                  'playground', 'flux', 'sdxl', 'sd-', '/image', 'ideogram', 'recraft', 'kolors', 'pixart')
+
+# Compiled once; case-insensitive search avoids lowercasing every model ID
+_REASONING_RE = re.compile("|".join(map(re.escape, REASONING_PATTERNS)), re.IGNORECASE)
+_IMAGE_RE = re.compile("|".join(map(re.escape, IMAGE_PATTERNS)), re.IGNORECASE)
+
+
+DEC_ZERO = Decimal("0")
+
+
+def _to_dec(value) -> Decimal:
+    """Convert a JSON cost value to Decimal; only floats take the str() round trip."""
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, (int, str)):
+        return Decimal(value)
+    if value is None:
+        return DEC_ZERO
+    return Decimal(str(value))  # shortest repr, so 0.1 stays 0.1
+
+
+@lru_cache(maxsize=4096)
+def _is_reasoning(model_id: str) -> bool:
+    """Memoized reasoning-model check (model IDs are few and repeat on every view)."""
+    return _REASONING_RE.search(model_id) is not None
+
+
+@lru_cache(maxsize=4096)
+def _is_image(model_id: str) -> bool:
+    """Memoized image-generation model check."""
+    return _IMAGE_RE.search(model_id) is not None
 
 
 class CollapsibleFrame(ttk.Frame):
     """A collapsible/expandable frame widget."""
     
-    def __init__(self, parent, text="", *args, **kwargs):
+    def __init__(self, parent, text="", *args, content_builder=None, **kwargs):
         super().__init__(parent, *args, **kwargs)
         
         self.columnconfigure(0, weight=1)
@@ -35,8 +88,7 @@ class CollapsibleFrame(ttk.Frame):
         self.toggle_btn = ttk.Button(
             self.header,
             text="▼ " + text,
-            command=self._toggle,
-            width=len(text) + 3
+            command=self._toggle
         )
         self.toggle_btn.pack(side="left", fill="x", expand=True)
         
@@ -48,16 +100,37 @@ class CollapsibleFrame(ttk.Frame):
         # Reasoning control
         self.enable_reasoning_var = tk.BooleanVar(value=False)
         
+        # Content is built on demand when a builder is given
+        self._content_builder = content_builder
+        self._built = content_builder is None
+        
+        # Parent grid row weight, released while collapsed so the space goes to other sections
+        self._row_weight = None
+        
+    def build_content(self):
+        """Run the content builder once; safe to call repeatedly."""
+        if not self._built:
+            self._built = True
+            self._content_builder(self.content)
+        
     def _toggle(self):
         """Toggle the frame expansion."""
         if self.is_expanded.get():
             # Collapse
             self.content.grid_remove()
+            row = self.grid_info().get("row")
+            if row is not None:
+                self._row_weight = self.master.rowconfigure(row)["weight"]
+                self.master.rowconfigure(row, weight=0)
             self.toggle_btn.config(text="▶ " + self.text)
             self.is_expanded.set(False)
         else:
             # Expand
+            self.build_content()
             self.content.grid()
+            row = self.grid_info().get("row")
+            if row is not None and self._row_weight is not None:
+                self.master.rowconfigure(row, weight=self._row_weight)
             self.toggle_btn.config(text="▼ " + self.text)
             self.is_expanded.set(True)
     
@@ -75,6 +148,16 @@ class OpenRouterGUI:
     DEFAULT_TOP_K = 40
     DEFAULT_MAX_TOKENS = 1024
     
+    # Default number of models queried in parallel
+    DEFAULT_MAX_WORKERS = 4
+    
+    # Log view is trimmed back to TRIM_LOG_TO_LINES once it exceeds MAX_LOG_LINES
+    MAX_LOG_LINES = 5000
+    TRIM_LOG_TO_LINES = 4000
+    
+    # Available-models columns shown with "Show pricing"
+    PRICING_COLUMNS = ("context", "input", "output", "rsn")
+    
     # Default skip keywords
     DEFAULT_SKIP_KEYWORDS = "embedding,rerank,moderation,whisper,tts,vision-only"
     
@@ -87,37 +170,17 @@ class OpenRouterGUI:
         style = ttk.Style()
         if self.root.tk.call('tk', 'windowingsystem') == 'aqua':  # macOS only
             style.configure('TButton', padding=(0, 2))  # Reduce vertical padding
+        style.configure('Models.Treeview', font=("Courier", 12), rowheight=22)
             
-        # Create main canvas with scrollbar for vertical scrolling
-        self.main_canvas = tk.Canvas(self.root, highlightthickness=0)
-        self.scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=self.main_canvas.yview)
-        self.scrollable_frame = ttk.Frame(self.main_canvas)
-        
-        # Configure scrollable region
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
-        )
-        
-        self.canvas_frame = self.main_canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.main_canvas.configure(yscrollcommand=self.scrollbar.set)
-        
-        # Bind canvas width to frame width for proper resizing
-        self.main_canvas.bind('<Configure>', self._on_canvas_configure)
-        
-        # Pack canvas and scrollbar
-        self.main_canvas.pack(side="left", fill="both", expand=True)
-        self.scrollbar.pack(side="right", fill="y")
-        
-        # Bind mousewheel to canvas for scrolling
-        self.main_canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.main_canvas.bind_all("<Button-4>", self._on_mousewheel)
-        self.main_canvas.bind_all("<Button-5>", self._on_mousewheel)
+        # Sections live directly in the window; collapsing them is how the page fits
+        self.main_frame = ttk.Frame(self.root)
+        self.main_frame.pack(fill="both", expand=True)
         
         self.client = None
+        self._client_key = None
         self.logger = None
         self.available_models = []
-        self.selected_models = []
+        self.model_by_id = {}
         
         # Sorting variables
         self.model_costs = {}
@@ -127,6 +190,11 @@ class OpenRouterGUI:
         
         # Execution tracking
         self.execution_results = []
+        self._run_total = 0
+        self._total_cost = DEC_ZERO  # Running cost of the current run, in USD
+        self._executor = None  # Pool of the run in progress, so closing the window can cancel it
+        self._stop_event = threading.Event()  # Set when the window closes
+        self._ui_calls = queue.SimpleQueue()  # Callbacks posted by worker threads, run by _drain_logs
         self.usd_to_inr = 89.5
         
         # Session balance tracking
@@ -137,40 +205,116 @@ class OpenRouterGUI:
         # Cache for models
         self.models_loaded = False
         
+        # Available-models view: skip-filtered, sorted IDs and their search keys
+        self._model_ids = []
+        self._model_lc = []
+        self._filter_after_id = None
+        self._display_after_id = None
+        self._last_search = ("", None)  # (casefolded text, matching (id, key) pairs)
+        
+        # Per-load caches aligned with available_models
+        self._sort_orders = {}
+        self._search_keys = []
+        self._tree_populated = False
+        self._tree_ids = []  # Every row inserted in available_tree, attached or not
+        self._log_lines = 0  # Lines currently in log_text, maintained by _drain_logs
+        
+        self._create_variables()
         self._create_widgets()
         self._init_logger()
+        
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
     
-    def _on_canvas_configure(self, event):
-        """Update the canvas window width when canvas is resized."""
-        self.main_canvas.itemconfig(self.canvas_frame, width=event.width)
+    def _on_close(self):
+        """Stop queued model requests, then close the window."""
+        # Requests already in flight still finish (they may be billed); queued ones are never sent
+        self._stop_event.set()
+        executor = self._executor
+        if executor is not None:
+            try:
+                executor.shutdown(wait=False, cancel_futures=True)
+            except TypeError:  # Python 3.8: queued jobs still see the stop flag and skip sending
+                executor.shutdown(wait=False)
+        self.root.destroy()
     
-    def _on_mousewheel(self, event):
-        """Handle mousewheel scrolling for Windows and Linux."""
-        if event.num == 4:
-            self.main_canvas.yview_scroll(-1, "units")
-        elif event.num == 5:
-            self.main_canvas.yview_scroll(1, "units")
-        else:
-            self.main_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+    def _create_variables(self):
+        """Create the Tk variables behind every section, built or not."""
+        # API & proxy
+        self.api_key_var = tk.StringVar()
+        self.proxy_enabled_var = tk.BooleanVar(value=False)
+        self.proxy_url_var = tk.StringVar(value="http://127.0.0.1:8080")
+        self.verify_ssl_var = tk.BooleanVar(value=False)
+        
+        # Model selection
+        self.show_pricing_var = tk.BooleanVar(value=False)
+        self.skip_keywords_var = tk.StringVar(value=self.DEFAULT_SKIP_KEYWORDS)
+        self.skip_enabled_var = tk.BooleanVar(value=True)
+        self._skip_re = None
+        self._rebuild_skip_re()
+        self.skip_keywords_var.trace("w", self._rebuild_skip_re)
+        self.skip_enabled_var.trace("w", self._rebuild_skip_re)
+        self.search_var = tk.StringVar()
+        
+        # LLM parameters
+        self.temp_var = tk.DoubleVar(value=self.DEFAULT_TEMP)
+        self.top_p_var = tk.DoubleVar(value=self.DEFAULT_TOP_P)
+        self.top_k_var = tk.IntVar(value=self.DEFAULT_TOP_K)
+        self.max_tokens_var = tk.IntVar(value=self.DEFAULT_MAX_TOKENS)
+        self.enable_reasoning_var = tk.BooleanVar(value=False)
+        
+        # Execution
+        self.max_workers_var = tk.IntVar(value=self.DEFAULT_MAX_WORKERS)
     
     def _create_widgets(self):
-        """Create all GUI components."""
+        """Create all GUI components.
+        
+        Only the Execution & Logs section (which hosts the logger) is built
+        immediately; the other sections are filled in once the window is idle.
+        """
         
         # ===== API & PROXY CONFIGURATION (COLLAPSIBLE) =====
-        api_proxy_collapsible = CollapsibleFrame(self.scrollable_frame, text="API & Proxy Configuration")
+        api_proxy_collapsible = CollapsibleFrame(self.main_frame, text="API & Proxy Configuration",
+                                                 content_builder=self._build_api_section)
         api_proxy_collapsible.grid(row=0, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
-        api_proxy_content = api_proxy_collapsible.get_content_frame()
-        api_proxy_content.columnconfigure(1, weight=1)
         
-        # API Key section in api_proxy_content
-        ttk.Label(api_proxy_content, text="API Key:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        # ===== MODEL SELECTION (COLLAPSIBLE) =====
+        model_collapsible = CollapsibleFrame(self.main_frame, text="Model Selection",
+                                             content_builder=self._build_model_section)
+        model_collapsible.grid(row=1, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
+        
+        # ===== LLM PARAMETERS & PROMPTS (COLLAPSIBLE) =====
+        params_prompts_collapsible = CollapsibleFrame(self.main_frame, text="LLM Parameters & Prompts",
+                                                      content_builder=self._build_params_section)
+        params_prompts_collapsible.grid(row=2, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
+        
+        # ===== EXECUTION (COLLAPSIBLE) =====
+        exec_collapsible = CollapsibleFrame(self.main_frame, text="Execution & Logs",
+                                            content_builder=self._build_exec_section)
+        exec_collapsible.grid(row=3, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
+        exec_collapsible.build_content()
+        
+        # Configure grid weights
+        self.main_frame.columnconfigure(0, weight=1)
+        self.main_frame.rowconfigure(1, weight=1)
+        self.main_frame.rowconfigure(2, weight=1)
+        self.main_frame.rowconfigure(3, weight=2)
+        
+        # Fill in the remaining sections after the first paint
+        for section in (api_proxy_collapsible, model_collapsible, params_prompts_collapsible):
+            self.root.after_idle(section.build_content)
+    
+    def _build_api_section(self, content):
+        """Build the API key and proxy settings."""
+        content.columnconfigure(1, weight=1)
+        
+        # API Key section
+        ttk.Label(content, text="API Key:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
 
         # Frame for API key entry and show/hide button
-        api_key_frame = ttk.Frame(api_proxy_content)
+        api_key_frame = ttk.Frame(content)
         api_key_frame.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
         api_key_frame.columnconfigure(0, weight=1)
 
-        self.api_key_var = tk.StringVar()
         self.api_key_entry = ttk.Entry(api_key_frame, textvariable=self.api_key_var, show="*", width=50)
         self.api_key_entry.grid(row=0, column=0, sticky="ew")
 
@@ -178,56 +322,53 @@ class OpenRouterGUI:
         self.show_api_key_btn = ttk.Button(api_key_frame, text="👁", width=3, command=self._toggle_api_key_visibility)
         self.show_api_key_btn.grid(row=0, column=1, padx=(5, 0))
 
-        self.check_balance_btn = ttk.Button(api_proxy_content, text="Check Key Balance", command=self._check_key_balance)
+        self.check_balance_btn = ttk.Button(content, text="Check Key Balance", command=self._check_key_balance)
         self.check_balance_btn.grid(row=0, column=2, padx=5, pady=5)
 
-        self.balance_label = ttk.Label(api_proxy_content, text="Balance: Not checked", foreground="gray")
+        self.balance_label = ttk.Label(content, text="Balance: Not checked", foreground="gray")
         self.balance_label.grid(row=0, column=3, padx=10, pady=5, sticky="w")
 
         
         # Proxy settings
-        ttk.Label(api_proxy_content, text="Proxy:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
+        ttk.Label(content, text="Proxy:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
         
-        proxy_frame = ttk.Frame(api_proxy_content)
+        proxy_frame = ttk.Frame(content)
         proxy_frame.grid(row=1, column=1, columnspan=3, sticky="ew", padx=5, pady=5)
         
-        self.proxy_enabled_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(proxy_frame, text="Route via Burp", variable=self.proxy_enabled_var).pack(side="left", padx=5)
         
-        self.proxy_url_var = tk.StringVar(value="http://127.0.0.1:8080")
         ttk.Entry(proxy_frame, textvariable=self.proxy_url_var, width=30).pack(side="left", padx=5)
         
-        self.verify_ssl_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(proxy_frame, text="Verify SSL", variable=self.verify_ssl_var).pack(side="left", padx=5)
-        
-        # ===== MODEL SELECTION (COLLAPSIBLE) =====
-        model_collapsible = CollapsibleFrame(self.scrollable_frame, text="Model Selection")
-        model_collapsible.grid(row=1, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
-        model_content = model_collapsible.get_content_frame()
-        model_content.columnconfigure(0, weight=1)
-        model_content.columnconfigure(2, weight=1)
-        model_content.rowconfigure(2, weight=1)
+    
+    def _build_model_section(self, content):
+        """Build the available/selected model lists and their controls."""
+        content.columnconfigure(0, weight=1)
+        content.columnconfigure(2, weight=1)
+        content.rowconfigure(2, weight=1)
         
         # Model loading options
-        load_options_frame = ttk.Frame(model_content)
+        load_options_frame = ttk.Frame(content)
         load_options_frame.grid(row=0, column=0, columnspan=4, sticky="ew", pady=(0, 5))
         
-        self.show_pricing_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(load_options_frame, text="Show pricing", variable=self.show_pricing_var).pack(side="left", padx=5)
+        ttk.Checkbutton(load_options_frame, text="Show pricing", variable=self.show_pricing_var,
+                        command=self._apply_skip_filter).pack(side="left", padx=5)
         
         ttk.Button(load_options_frame, text="Load Models", command=self._load_models).pack(side="left", padx=5)
+        ttk.Button(load_options_frame, text="Refresh",
+                   command=lambda: self._load_models(force_refresh=True)).pack(side="left", padx=5)
         
         # Skip keywords
         ttk.Label(load_options_frame, text="Skip keywords:").pack(side="left", padx=(20, 5))
-        self.skip_keywords_var = tk.StringVar(value=self.DEFAULT_SKIP_KEYWORDS)
-        ttk.Entry(load_options_frame, textvariable=self.skip_keywords_var, width=40).pack(side="left", padx=5)
+        skip_entry = ttk.Entry(load_options_frame, textvariable=self.skip_keywords_var, width=40)
+        skip_entry.pack(side="left", padx=5)
+        skip_entry.bind("<KeyRelease>", self._schedule_display)
         
-        self.skip_enabled_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(load_options_frame, text="Apply filter", variable=self.skip_enabled_var, 
                        command=self._apply_skip_filter).pack(side="left", padx=5)
         
         # Sorting options
-        sort_frame = ttk.Frame(model_content)
+        sort_frame = ttk.Frame(content)
         sort_frame.grid(row=1, column=0, columnspan=4, sticky="ew", pady=(0, 5))
         
         ttk.Checkbutton(sort_frame, text="Sort by", variable=self.sort_by_cost_var,
@@ -243,42 +384,55 @@ class OpenRouterGUI:
             
                 
         # Available models (left) - WITH HORIZONTAL SCROLL
-        left_frame = ttk.Frame(model_content)
+        left_frame = ttk.Frame(content)
         left_frame.grid(row=2, column=0, sticky="nsew", padx=5)
         left_frame.rowconfigure(2, weight=1)
         left_frame.columnconfigure(0, weight=1)
 
         ttk.Label(left_frame, text="Available Models").grid(row=0, column=0, columnspan=2, sticky="w")
 
-        self.search_var = tk.StringVar()
-        self.search_var.trace("w", self._filter_models)
-        ttk.Entry(left_frame, textvariable=self.search_var).grid(row=1, column=0, columnspan=2, sticky="ew", pady=5)
+        search_entry = ttk.Entry(left_frame, textvariable=self.search_var)
+        search_entry.grid(row=1, column=0, columnspan=2, sticky="ew", pady=5)
+        # A variable trace also catches mouse pastes and programmatic changes
+        self.search_var.trace_add("write", self._schedule_filter)
 
-        # Use Text widget with larger size and better selection
-        self.available_text = tk.Text(left_frame, width=80, height=15, font=("Courier", 12), 
-                                     wrap=tk.NONE, cursor="hand2")
-        self.available_text.grid(row=2, column=0, sticky="nsew")
+        # Treeview keyed by model ID (iid); only visible rows are drawn
+        self.available_tree = ttk.Treeview(left_frame, columns=self.PRICING_COLUMNS, show="tree headings",
+                                           height=15, selectmode="extended", style="Models.Treeview")
+        self.available_tree.grid(row=2, column=0, sticky="nsew")
+        self.available_tree.heading("#0", text="Model ID", anchor="w")
+        self.available_tree.column("#0", width=480, stretch=True)
+        self.available_tree.heading("context", text="Context", anchor="w",
+                                    command=lambda: self._sort_by_column("context"))
+        self.available_tree.column("context", width=90, stretch=False)
+        self.available_tree.heading("input", text="In $/M", anchor="w",
+                                    command=lambda: self._sort_by_column("input"))
+        self.available_tree.column("input", width=90, stretch=False)
+        self.available_tree.heading("output", text="Out $/M", anchor="w")
+        self.available_tree.column("output", width=90, stretch=False)
+        self.available_tree.heading("rsn", text="Rsn", anchor="w")
+        self.available_tree.column("rsn", width=50, stretch=False)
+        self.available_tree.configure(displaycolumns=())
 
-        # Bind single click for selection and double-click for add
-        self.available_text.bind("<Button-1>", self._on_available_click)
-        self.available_text.bind("<Double-Button-1>", self._on_available_double_click)
+        # Double-click adds the row under the pointer; click/shift/ctrl selection is native
+        self.available_tree.bind("<Double-Button-1>", self._on_available_double_click)
 
         # Vertical scrollbar
-        scroll1_v = ttk.Scrollbar(left_frame, orient="vertical", command=self.available_text.yview)
+        scroll1_v = ttk.Scrollbar(left_frame, orient="vertical", command=self.available_tree.yview)
         scroll1_v.grid(row=2, column=1, sticky="ns")
 
         # Horizontal scrollbar
-        scroll1_h = ttk.Scrollbar(left_frame, orient="horizontal", command=self.available_text.xview)
+        scroll1_h = ttk.Scrollbar(left_frame, orient="horizontal", command=self.available_tree.xview)
         scroll1_h.grid(row=3, column=0, sticky="ew")
 
-        self.available_text.config(yscrollcommand=scroll1_v.set, xscrollcommand=scroll1_h.set)
+        self.available_tree.config(yscrollcommand=scroll1_v.set, xscrollcommand=scroll1_h.set)
         
         
         
         
 
         # Control buttons (middle)
-        btn_frame = ttk.Frame(model_content)
+        btn_frame = ttk.Frame(content)
         btn_frame.grid(row=2, column=1, padx=10)
 
         ttk.Button(btn_frame, text="Double click to Add →", command=self._add_models).pack(pady=5)
@@ -286,7 +440,7 @@ class OpenRouterGUI:
         ttk.Button(btn_frame, text="Clear All", command=self._clear_selected).pack(pady=5)
 
         # Selected models (right) - WITH HORIZONTAL SCROLL
-        right_frame = ttk.Frame(model_content)
+        right_frame = ttk.Frame(content)
         right_frame.grid(row=2, column=2, sticky="nsew", padx=5)
         right_frame.rowconfigure(2, weight=1)
         right_frame.columnconfigure(0, weight=1)
@@ -295,84 +449,81 @@ class OpenRouterGUI:
         self.selected_count_label = ttk.Label(right_frame, text="(0 selected)", foreground="#FF8C00")
         self.selected_count_label.grid(row=1, column=0, columnspan=2, sticky="w")
 
-        # Match font size with available models
-        self.selected_listbox = tk.Listbox(right_frame, selectmode=tk.EXTENDED, 
-                                           width=40, height=15, font=("Courier", 12))
-        self.selected_listbox.grid(row=2, column=0, sticky="nsew")
+        # Treeview keyed by model ID (iid); its rows are the selection, in order
+        self.selected_tree = ttk.Treeview(right_frame, show="tree", height=15,
+                                          selectmode="extended", style="Models.Treeview")
+        self.selected_tree.grid(row=2, column=0, sticky="nsew")
+        self.selected_tree.column("#0", width=400, stretch=True)
 
         # Vertical scrollbar
-        scroll2_v = ttk.Scrollbar(right_frame, orient="vertical", command=self.selected_listbox.yview)
+        scroll2_v = ttk.Scrollbar(right_frame, orient="vertical", command=self.selected_tree.yview)
         scroll2_v.grid(row=2, column=1, sticky="ns")
 
         # Horizontal scrollbar
-        scroll2_h = ttk.Scrollbar(right_frame, orient="horizontal", command=self.selected_listbox.xview)
+        scroll2_h = ttk.Scrollbar(right_frame, orient="horizontal", command=self.selected_tree.xview)
         scroll2_h.grid(row=3, column=0, sticky="ew")
 
-        self.selected_listbox.config(yscrollcommand=scroll2_v.set, xscrollcommand=scroll2_h.set)
-
-
+        self.selected_tree.config(yscrollcommand=scroll2_v.set, xscrollcommand=scroll2_h.set)
         
-        # ===== LLM PARAMETERS & PROMPTS (COLLAPSIBLE) =====
-        params_prompts_collapsible = CollapsibleFrame(self.scrollable_frame, text="LLM Parameters & Prompts")
-        params_prompts_collapsible.grid(row=2, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
-        params_content = params_prompts_collapsible.get_content_frame()
-        params_content.columnconfigure(0, weight=1)
-        params_content.rowconfigure(2, weight=1)
-        params_content.rowconfigure(4, weight=1)
+        # Setup keyboard shortcuts
+        self._setup_shortcuts()
+    
+    def _build_params_section(self, content):
+        """Build the sampling parameters and prompt editors."""
+        content.columnconfigure(0, weight=1)
+        content.rowconfigure(2, weight=1)
+        content.rowconfigure(4, weight=1)
         
         # LLM Parameters
-        param_frame = ttk.LabelFrame(params_content, text="Parameters", padding=10)
+        param_frame = ttk.LabelFrame(content, text="Parameters", padding=10)
         param_frame.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
         
         ttk.Label(param_frame, text="Temperature:").grid(row=0, column=0, sticky="w")
-        self.temp_var = tk.DoubleVar(value=self.DEFAULT_TEMP)
         ttk.Spinbox(param_frame, from_=0.0, to=2.0, increment=0.1, textvariable=self.temp_var, width=10).grid(row=0, column=1, padx=5, sticky="w")
         
         ttk.Label(param_frame, text="Top-p:").grid(row=0, column=2, sticky="w", padx=(20,0))
-        self.top_p_var = tk.DoubleVar(value=self.DEFAULT_TOP_P)
         ttk.Spinbox(param_frame, from_=0.0, to=1.0, increment=0.05, textvariable=self.top_p_var, width=10).grid(row=0, column=3, padx=5, sticky="w")
         
         ttk.Label(param_frame, text="Top-k:").grid(row=0, column=4, sticky="w", padx=(20,0))
-        self.top_k_var = tk.IntVar(value=self.DEFAULT_TOP_K)
         ttk.Spinbox(param_frame, from_=1, to=100, increment=1, textvariable=self.top_k_var, width=10).grid(row=0, column=5, padx=5, sticky="w")
         
         ttk.Label(param_frame, text="Max Tokens:").grid(row=0, column=6, sticky="w", padx=(20,0))
-        self.max_tokens_var = tk.IntVar(value=self.DEFAULT_MAX_TOKENS)
         ttk.Spinbox(param_frame, from_=1, to=4096, increment=128, textvariable=self.max_tokens_var, width=10).grid(row=0, column=7, padx=5, sticky="w")
         
         # Reasoning checkbox
-        self.enable_reasoning_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(param_frame, text="Enable Reasoning", 
                         variable=self.enable_reasoning_var).grid(row=0, column=8, padx=(20,0), sticky="w")
         
         ttk.Button(param_frame, text="Reset to Default", command=self._reset_parameters).grid(row=0, column=9, padx=(20,0))
         
         # Prompts
-        ttk.Label(params_content, text="System Prompt:").grid(row=1, column=0, sticky="w", padx=5)
-        self.system_prompt = scrolledtext.ScrolledText(params_content, height=5, width=80)
+        ttk.Label(content, text="System Prompt:").grid(row=1, column=0, sticky="w", padx=5)
+        self.system_prompt = scrolledtext.ScrolledText(content, height=5, width=80)
         self.system_prompt.grid(row=2, column=0, sticky="nsew", padx=5, pady=(0,10))
         
         default_system = """You are a school teacher."""
         self.system_prompt.insert("1.0", default_system)
         
-        ttk.Label(params_content, text="User Prompt:").grid(row=3, column=0, sticky="w", padx=5)
-        self.user_prompt = scrolledtext.ScrolledText(params_content, height=5, width=80)
+        ttk.Label(content, text="User Prompt:").grid(row=3, column=0, sticky="w", padx=5)
+        self.user_prompt = scrolledtext.ScrolledText(content, height=5, width=80)
         self.user_prompt.grid(row=4, column=0, sticky="nsew", padx=5)
-        
-        # ===== EXECUTION (COLLAPSIBLE) =====
-        exec_collapsible = CollapsibleFrame(self.scrollable_frame, text="Execution & Logs")
-        exec_collapsible.grid(row=3, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
-        exec_content = exec_collapsible.get_content_frame()
-        exec_content.columnconfigure(0, weight=1)
-        exec_content.rowconfigure(2, weight=1)
+    
+    def _build_exec_section(self, content):
+        """Build the run controls and log view."""
+        content.columnconfigure(0, weight=1)
+        content.rowconfigure(2, weight=1)
         
         # Control buttons
-        btn_container = ttk.Frame(exec_content)
+        btn_container = ttk.Frame(content)
         btn_container.grid(row=0, column=0, sticky="ew", pady=(0,10))
         
         self.run_btn = ttk.Button(btn_container, text="Run on Selected Models", command=self._run_models)
         self.run_btn.pack(side="left", padx=5)
         
+        # Concurrent requests; lower it if OpenRouter starts rate-limiting
+        ttk.Label(btn_container, text="Parallel:").pack(side="left", padx=(5, 2))
+        ttk.Spinbox(btn_container, from_=1, to=16, increment=1, textvariable=self.max_workers_var, width=4).pack(side="left", padx=(0, 5))
+        
         ttk.Button(btn_container, text="Clear Logs", command=self._clear_logs).pack(side="left", padx=5)
         
         ttk.Button(btn_container, text="Save Config", command=self._save_config).pack(side="left", padx=5)
@@ -382,32 +533,42 @@ class OpenRouterGUI:
         self.status_label.pack(side="left", padx=20)
         
         # Logs - WITH HORIZONTAL SCROLL
-        ttk.Label(exec_content, text="Logs:").grid(row=1, column=0, sticky="w")
+        ttk.Label(content, text="Logs:").grid(row=1, column=0, sticky="w")
 
-        log_frame = ttk.Frame(exec_content)
+        log_frame = ttk.Frame(content)
         log_frame.grid(row=2, column=0, sticky="nsew")
         log_frame.rowconfigure(0, weight=1)
         log_frame.columnconfigure(0, weight=1)
 
+        # Left NORMAL so appends need no state toggles; user edits are swallowed below
         self.log_text = scrolledtext.ScrolledText(log_frame, height=35, width=80, 
-                                                 state=tk.DISABLED, wrap=tk.NONE, font=("Courier", 11))
+                                                 wrap=tk.NONE, font=("Courier", 11))
         self.log_text.grid(row=0, column=0, sticky="nsew")
+        
+        # Control is 0x4 everywhere; 0x8 is Command only on macOS (NumLock/Alt elsewhere)
+        aqua = self.root.tk.call("tk", "windowingsystem") == "aqua"
+        self._copy_key_mask = 0x4 | (0x8 if aqua else 0)
+        self.log_text.bind("<Key>", self._on_log_key)
+        for sequence in ("<<Paste>>", "<<Cut>>", "<<Clear>>", "<<PasteSelection>>"):
+            self.log_text.bind(sequence, lambda e: "break")
 
         # Horizontal scrollbar (vertical is built into ScrolledText)
         log_scroll_h = ttk.Scrollbar(log_frame, orient="horizontal", command=self.log_text.xview)
         log_scroll_h.grid(row=1, column=0, sticky="ew")
         self.log_text.config(xscrollcommand=log_scroll_h.set)
-
-        
-        # Configure grid weights
-        self.scrollable_frame.columnconfigure(0, weight=1)
-        self.scrollable_frame.rowconfigure(1, weight=1)
-        self.scrollable_frame.rowconfigure(2, weight=1)
-        self.scrollable_frame.rowconfigure(3, weight=2)
-        
-        # Setup keyboard shortcuts
-        self._setup_shortcuts()
         
+    # Keys that navigate or copy in the read-only log view
+    _LOG_NAV_KEYS = frozenset(("Up", "Down", "Left", "Right", "Prior", "Next", "Home", "End",
+                               "Shift_L", "Shift_R", "Control_L", "Control_R"))
+    
+    def _on_log_key(self, event):
+        """Make the log view read-only while still allowing selection, copy and navigation."""
+        if event.keysym in self._LOG_NAV_KEYS:
+            return None
+        if event.state & self._copy_key_mask and event.keysym.lower() in ("c", "a"):  # Ctrl/Cmd+C, Ctrl/Cmd+A
+            return None
+        return "break"
+    
     def _toggle_api_key_visibility(self):
         """Toggle API key visibility between masked and plain text."""
         if self.api_key_entry.cget("show") == "*":
@@ -421,15 +582,15 @@ class OpenRouterGUI:
     def _setup_shortcuts(self):
         """Setup keyboard shortcuts for better UX."""
         # Ctrl+A to select all in available models
-        self.available_text.bind("<Control-a>", self._select_all_available)
-        self.available_text.bind("<Command-a>", self._select_all_available)  # macOS
+        self.available_tree.bind("<Control-a>", self._select_all_available)
+        self.available_tree.bind("<Command-a>", self._select_all_available)  # macOS
         
         # Enter key to add selected
-        self.available_text.bind("<Return>", lambda e: self._add_models())
+        self.available_tree.bind("<Return>", lambda e: self._add_models())
 
     def _select_all_available(self, event):
         """Select all models in available list."""
-        self.available_text.tag_add("sel", "3.0", tk.END)  # Skip header (lines 1-2)
+        self.available_tree.selection_set(self.available_tree.get_children())
         return "break"  # Prevent default behavior
         
         
@@ -440,9 +601,7 @@ class OpenRouterGUI:
         self.top_k_var.set(self.DEFAULT_TOP_K)
         self.max_tokens_var.set(self.DEFAULT_MAX_TOKENS)
         
-        self.log_text.config(state=tk.NORMAL)
         self.logger.log("Reset LLM parameters to default values")
-        self.log_text.config(state=tk.DISABLED)
     
 
     def _save_config(self):
@@ -474,24 +633,23 @@ class OpenRouterGUI:
                 "top_p": self.top_p_var.get(),
                 "top_k": self.top_k_var.get(),
                 "max_tokens": self.max_tokens_var.get(),
+                "max_workers": self.max_workers_var.get(),
                 "system_prompt": self.system_prompt.get("1.0", tk.END).strip(),
                 "user_prompt": self.user_prompt.get("1.0", tk.END).strip(),
-                "selected_models": self.selected_models
+                "selected_models": self._selected_model_ids()
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            with open(file_path, 'wb') as f:
+                f.write(_config_dumps(config))
             
             messagebox.showinfo("Success", 
                 f"Configuration saved to:\n{file_path}\n\n"
                 f"API Key: {'Saved ✓' if api_key else 'Empty ✗'}\n"
                 f"API Key Length: {len(api_key)} characters\n"
-                f"Selected Models: {len(self.selected_models)}")
+                f"Selected Models: {len(self.selected_tree.get_children())}")
             
-            self.log_text.config(state=tk.NORMAL)
             self.logger.log(f"Configuration saved to: {file_path}")
             self.logger.log(f"API key saved: {api_key[:8]}...{api_key[-4:]} ({len(api_key)} chars)" if api_key else "No API key saved")
-            self.log_text.config(state=tk.DISABLED)
             
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save configuration:\n{str(e)}")
@@ -511,8 +669,8 @@ class OpenRouterGUI:
             if not file_path:
                 return
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            with open(file_path, 'rb') as f:
+                config = _config_loads(f.read())
             
             if not isinstance(config, dict):
                 raise ValueError("Invalid configuration format")
@@ -521,13 +679,9 @@ class OpenRouterGUI:
             api_key = str(config.get("api_key", "")).strip()
             if api_key:
                 self.api_key_var.set(api_key)
-                self.log_text.config(state=tk.NORMAL)
                 self.logger.log(f"API key loaded: {api_key[:8]}...{api_key[-4:]} ({len(api_key)} chars)")
-                self.log_text.config(state=tk.DISABLED)
             else:
-                self.log_text.config(state=tk.NORMAL)
                 self.logger.log("No API key found in config file", level="WARNING")
-                self.log_text.config(state=tk.DISABLED)
             
             # Load boolean settings
             self.proxy_enabled_var.set(bool(config.get("proxy_enabled", False)))
@@ -562,6 +716,9 @@ class OpenRouterGUI:
             max_tokens = int(config.get("max_tokens", self.DEFAULT_MAX_TOKENS))
             self.max_tokens_var.set(max(1, min(4096, max_tokens)))
             
+            max_workers = int(config.get("max_workers", self.DEFAULT_MAX_WORKERS))
+            self.max_workers_var.set(max(1, min(16, max_workers)))
+            
             # Load prompts
             system_prompt = str(config.get("system_prompt", ""))
             self.system_prompt.delete("1.0", tk.END)
@@ -576,33 +733,61 @@ class OpenRouterGUI:
             # Load selected models
             selected = config.get("selected_models", [])
             if isinstance(selected, list):
-                self.selected_models = [str(m) for m in selected[:100]]
-                self.selected_listbox.delete(0, tk.END)
-                for model in self.selected_models:
-                    self.selected_listbox.insert(tk.END, model)
+                # dict.fromkeys drops duplicates (iids must be unique) while keeping file order
+                self._clear_selected_tree()
+                for model_id in dict.fromkeys(str(m) for m in selected[:100]):
+                    self.selected_tree.insert("", "end", iid=model_id, text=model_id)
                 self._update_selected_count()
             
-            # Force refresh the API key display
-            self.root.update_idletasks()
-            
             messagebox.showinfo("Success", 
                 f"Configuration loaded from:\n{file_path}\n\n"
                 f"API Key: {'Loaded ✓' if api_key else 'Not found ✗'}\n"
-                f"Selected Models: {len(self.selected_models)}")
+                f"Selected Models: {len(self.selected_tree.get_children())}")
             
-            self.log_text.config(state=tk.NORMAL)
             self.logger.log(f"Configuration loaded successfully from: {file_path}")
-            self.log_text.config(state=tk.DISABLED)
             
         except Exception as e:
             messagebox.showerror("Load Error", f"Failed to load configuration:\n{str(e)}")
 
     
     def _init_logger(self):
-        """Initialize the dual logger."""
-        self.log_text.config(state=tk.NORMAL)
+        """Initialize the dual logger and start the log drain loop."""
+        from logging_utils import DualLogger
+        
         self.logger = DualLogger(text_widget=self.log_text)
-        self.log_text.config(state=tk.DISABLED)
+        self._drain_logs()
+    
+    def _post(self, callback, *args):
+        """Queue callback(*args) to run on the Tk main thread (safe from any thread).
+        
+        Tk must only be called from the main thread, so worker threads never
+        touch root or the widgets themselves; _drain_logs() runs these for them.
+        """
+        self._ui_calls.put((callback, args))
+    
+    def _drain_logs(self):
+        """Run callbacks posted by worker threads, then write queued log lines
+        to the log view in one batch every 50 ms."""
+        while True:
+            try:
+                callback, args = self._ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
+        
+        if self.logger.has_pending():
+            self._log_lines += self.logger.flush()
+            
+            # Keep the view fast over long sessions; the log file keeps everything.
+            # The line count is tracked here so trimming needs no Tcl index math.
+            if self._log_lines > self.MAX_LOG_LINES:
+                first_kept = self._log_lines - self.TRIM_LOG_TO_LINES + 1
+                self.log_text.delete("1.0", f"{first_kept}.0")
+                self._log_lines = self.TRIM_LOG_TO_LINES
+        self.root.after(50, self._drain_logs)
     
     def _init_client(self):
         """Initialize or reinitialize the API client."""
@@ -613,23 +798,62 @@ class OpenRouterGUI:
         proxy_url = self.proxy_url_var.get() if self.proxy_enabled_var.get() else None
         verify_ssl = self.verify_ssl_var.get()
         
+        # Reuse the existing client (and its pooled session) while the
+        # connection settings are unchanged
+        client_key = (api_key, proxy_url, verify_ssl)
+        if self.client is not None and self._client_key == client_key:
+            return
+        
+        # Imported on first use: requests/urllib3 are not needed to show the window
+        from api_client import OpenRouterClient
+        
+        # Release the old client's pooled connections now instead of at GC;
+        # a request still in flight finishes and its connection is then discarded
+        if self.client is not None:
+            self.client.close()
+        
         self.client = OpenRouterClient(api_key=api_key, proxy_url=proxy_url, verify_ssl=verify_ssl)
+        self._client_key = client_key
     
     def _check_key_balance(self):
-        """Check and display API key balance with percentage comparison."""
+        """Fetch the API key balance in a background thread."""
         try:
             self._init_client()
-            key_info = self.client.get_key_info()
-            
-            limit = key_info.get("limit", 0)
-            usage = key_info.get("usage", 0)
-            
-            limit_decimal = Decimal(str(limit))
-            usage_decimal = Decimal(str(usage))
-            remaining = limit_decimal - usage_decimal
+        except Exception as e:
+            self._show_balance_error(e)
+            return
+        
+        # An explicit check should always hit the API, not the key info cache
+        self.client.invalidate_key_info()
+        self.check_balance_btn.config(state=tk.DISABLED)
+        self.balance_label.config(text="Balance: Checking...", foreground="orange")
+        threading.Thread(target=self._fetch_balance_worker, args=(self.client,), daemon=True).start()
+    
+    def _fetch_balance_worker(self, client):
+        """Request key info off the Tk thread and hand the result back to it."""
+        try:
+            key_info = client.get_key_info()
+            self._post(self._apply_balance, key_info)
+        except Exception as e:
+            self._post(self._show_balance_error, e)
+        finally:
+            self._post(lambda: self.check_balance_btn.config(state=tk.NORMAL))
+    
+    def _show_balance_error(self, error: Exception):
+        """Report a failed balance check (main thread)."""
+        self.balance_label.config(text=f"Error: {str(error)}", foreground="red")
+        messagebox.showerror("Balance Error", str(error))
+    
+    def _apply_balance(self, key_info: dict):
+        """Display API key balance with percentage comparison (main thread)."""
+        try:
+            # Display-only math: float is exact enough at 7 decimals (null limit = unlimited key)
+            limit = float(key_info.get("limit") or 0)
+            usage = float(key_info.get("usage") or 0)
+            remaining = limit - usage
             
-            if limit_decimal > 0:
-                percentage_remaining = (remaining / limit_decimal) * 100
+            if limit > 0:
+                percentage_remaining = (remaining / limit) * 100
                 
                 self.balance_check_count += 1
                 
@@ -642,10 +866,8 @@ class OpenRouterGUI:
                         foreground="green"
                     )
                     
-                    self.log_text.config(state=tk.NORMAL)
                     self.logger.log_key_balance(key_info)
                     self.logger.log("→ Initial balance recorded for session")
-                    self.log_text.config(state=tk.DISABLED)
                 else:
                     diff_from_last = self.last_balance - remaining
                     diff_from_initial = self.initial_balance - remaining
@@ -658,11 +880,9 @@ class OpenRouterGUI:
                         foreground="green"
                     )
                     
-                    self.log_text.config(state=tk.NORMAL)
                     self.logger.log_key_balance(key_info)
                     self.logger.log(f"→ Δ since last: ${diff_from_last:.7f} ({pct_change_from_last:+.3f}%)")
                     self.logger.log(f"→ Δ since start: ${diff_from_initial:.7f} ({pct_change_from_initial:+.3f}%)")
-                    self.log_text.config(state=tk.DISABLED)
                     
                     self.last_balance = remaining
             else:
@@ -671,44 +891,43 @@ class OpenRouterGUI:
                     foreground="green"
                 )
                 
-                self.log_text.config(state=tk.NORMAL)
                 self.logger.log_key_balance(key_info)
-                self.log_text.config(state=tk.DISABLED)
                 
         except Exception as e:
-            self.balance_label.config(text=f"Error: {str(e)}", foreground="red")
-            messagebox.showerror("Balance Error", str(e))
+            self._show_balance_error(e)
     
     def _apply_skip_filter(self):
-        """Reapply skip filter when checkbox changes."""
+        """Reapply skip filter when checkbox, keywords or pricing view change."""
+        self._display_after_id = None
         if self.models_loaded:
             self._display_available_models()
     
+    def _rebuild_skip_re(self, *args):
+        """Compile the skip keywords into one case-insensitive pattern (None = skip nothing)."""
+        # Deduplicated (case-insensitively) so repeated keywords add no alternation branches
+        keywords = list(dict.fromkeys(kw.strip().lower() for kw in self.skip_keywords_var.get().split(",") if kw.strip()))
+        if self.skip_enabled_var.get() and keywords:
+            self._skip_re = re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+        else:
+            self._skip_re = None
+    
     def _should_skip_model(self, model_id: str) -> bool:
         """Check if model should be skipped based on keywords."""
-        if not self.skip_enabled_var.get():
-            return False
-        
-        keywords = [kw.strip().lower() for kw in self.skip_keywords_var.get().split(",") if kw.strip()]
-        model_id_lower = model_id.lower()
-        
-        return any(keyword in model_id_lower for keyword in keywords)
+        return self._skip_re is not None and self._skip_re.search(model_id) is not None
     
-    def _load_models(self):
-        """Load available models from API (only once per session)."""
-        if self.models_loaded and self.available_models:
-            self.log_text.config(state=tk.NORMAL)
+    def _load_models(self, force_refresh: bool = False):
+        """Load available models from API (once per session unless force_refresh)."""
+        if self.models_loaded and self.available_models and not force_refresh:
             self.logger.log(f"Using cached models ({len(self.available_models)} models)")
-            self.log_text.config(state=tk.DISABLED)
             self._display_available_models()
             return
         
         try:
             self._init_client()
             self.status_label.config(text="Loading models...", foreground="orange")
-            self.root.update()
+            self.root.update_idletasks()  # Paint the status only; no event processing mid-handler
             
-            self.available_models = self.client.list_models(include_pricing=True)
+            self.available_models = self.client.list_models(include_pricing=True, force_refresh=force_refresh)
             
             # Store pricing data
             self.model_pricing = {}
@@ -719,12 +938,11 @@ class OpenRouterGUI:
                         "output_price": model.get("completion_price", 0)
                     }
             
+            self._build_model_caches()
             self.models_loaded = True
             self._display_available_models()
             
-            self.log_text.config(state=tk.NORMAL)
             self.logger.log(f"Loaded {len(self.available_models)} models from API (cached)")
-            self.log_text.config(state=tk.DISABLED)
             
             self.status_label.config(text=f"Loaded {len(self.available_models)} models", foreground="green")
             
@@ -732,100 +950,134 @@ class OpenRouterGUI:
             self.status_label.config(text="Error loading models", foreground="red")
             messagebox.showerror("Load Models Error", str(e))
     
-    def _display_available_models(self):
-        """Display available models with aligned pricing."""
-        if not self.models_loaded or not self.available_models:
-            return
+    def _build_model_caches(self):
+        """Precompute sort permutations, search keys and the ID index once per model load."""
+        models = self.available_models
+        self.model_by_id = {model["id"]: model for model in models}
+        indices = range(len(models))
+        
+        # Keys extracted once; sorting then indexes a list in C instead of calling a lambda
+        input_keys = [self.model_pricing.get(model["id"], {}).get("input_price", 0) for model in models]
+        context_keys = [model.get("context_length", 0) for model in models]
+        self._sort_orders = {
+            "input": sorted(indices, key=input_keys.__getitem__, reverse=True),
+            "context": sorted(indices, key=context_keys.__getitem__, reverse=True),
+        }
+        self._search_keys = [f"{model['id']}\n{model['name']}".casefold() for model in models]
+        self._tree_populated = False
+    
+    def _populate_available_tree(self):
+        """Insert one row per loaded model; later views only reorder or detach them."""
+        tree = self.available_tree
+        # get_children() omits rows detached by the search/skip filters; delete those too
+        if self._tree_ids:
+            tree.delete(*self._tree_ids)
+        self._tree_ids = [model["id"] for model in self.available_models]
+        rows = [(model["id"], self._pricing_values(model)) for model in self.available_models]
+        
+        # Raw widget command: skips Treeview.insert's per-row option-dict formatting
+        call, path = tree.tk.call, str(tree)
+        for model_id, values in rows:
+            call(path, "insert", "", "end", "-id", model_id, "-text", model_id, "-values", values)
+        self._tree_populated = True
+    
+    def _pricing_values(self, model: dict) -> tuple:
+        """Format the pricing columns of one model."""
+        # Already imported by the client that loaded the models; memoized per size
+        from api_client import format_context_length
         
-        self._filter_models()
+        ctx_str = format_context_length(model.get("context_length", 0))
+        
+        # Get pricing
+        pricing = self.model_pricing.get(model["id"], {})
+        in_price = pricing.get("input_price", 0)
+        out_price = pricing.get("output_price", 0)
+        
+        # Check if reasoning model
+        is_reasoning = self._is_reasoning_model(model["id"])
+        rsn_indicator = "✓" if is_reasoning else "-"
+        
+        return (ctx_str, f"${in_price:.3f}", f"${out_price:.3f}", rsn_indicator)
     
-    def _filter_models(self, *args):
-        """Filter and display models with aligned columns."""
+    def _display_available_models(self):
+        """Show skip-filtered, sorted models with optional pricing columns, then apply the search."""
         if not self.models_loaded or not self.available_models:
             return
         
-        search_text = self.search_var.get().lower()
+        if not self._tree_populated:
+            self._populate_available_tree()
         
-        # Filter models
-        filtered_models = []
-        for model in self.available_models:
-            if self._should_skip_model(model["id"]):
-                continue
-            
-            if search_text:
-                if search_text not in model["id"].lower() and search_text not in model["name"].lower():
-                    continue
-            
-            filtered_models.append(model)
+        models = self.available_models
         
-        # Sort if enabled
+        # Sort if enabled (cached permutation; load order is by ID)
+        order = range(len(models))
         if self.sort_by_cost_var.get():
-            sort_type = self.sort_cost_type_var.get()
-            
-            def get_sort_key(model):
-                if sort_type == "input":
-                    return self.model_pricing.get(model["id"], {}).get("input_price", 0)
-                elif sort_type == "context":
-                    return model.get("context_length", 0)
-                return 0
-            
-            filtered_models = sorted(filtered_models, key=get_sort_key, reverse=True)
+            order = self._sort_orders.get(self.sort_cost_type_var.get(), order)
         
-        # Display with aligned columns
-        self.available_text.config(state=tk.NORMAL)
-        self.available_text.delete("1.0", tk.END)
+        # Skip filter (pattern compiled once per keyword edit; no per-model method call)
+        skip_re = self._skip_re
+        if skip_re is None:
+            visible = list(order)
+        else:
+            search = skip_re.search
+            visible = [i for i in order if search(models[i]["id"]) is None]
+        
+        # Cache the view so searching only reorders/detaches existing rows
+        self._model_ids = [models[i]["id"] for i in visible]
+        self._model_lc = [self._search_keys[i] for i in visible]
+        self._last_search = ("", None)  # The narrowing shortcut only holds within one view
         
         show_pricing = self.show_pricing_var.get()
+        self.available_tree.configure(displaycolumns=self.PRICING_COLUMNS if show_pricing else ())
         
-        if show_pricing:
-            # Header with Reasoning column
-            header = f"{'Model ID':<55} {'Context':<10} {'In $/M':<10} {'Out $/M':<10} {'Rsn':<5}\n"
-            self.available_text.insert(tk.END, header, "header")
-            self.available_text.insert(tk.END, "-" * 90 + "\n", "header")
-            
-            # Model rows
-            for model in filtered_models:
-                model_id = model["id"][:53]
-                ctx = model.get("context_length", 0)
-                
-                # Format context
-                if ctx >= 1_000_000:
-                    ctx_str = f"{ctx/1_000_000:.1f}M"
-                elif ctx >= 1000:
-                    ctx_str = f"{ctx/1000:.0f}K"
-                else:
-                    ctx_str = f"{ctx}"
-                
-                # Get pricing
-                pricing = self.model_pricing.get(model["id"], {})
-                in_price = pricing.get("input_price", 0)
-                out_price = pricing.get("output_price", 0)
-                
-                # Check if reasoning model
-                is_reasoning = self._is_reasoning_model(model["id"])
-                rsn_indicator = "✓" if is_reasoning else "-"
-                
-                line = f"{model_id:<55} {ctx_str:<10} ${in_price:<9.3f} ${out_price:<9.3f} {rsn_indicator:<5}\n"
-                self.available_text.insert(tk.END, line)
-                    
-                line_start = f"{self.available_text.index(tk.END)}-2l"
-                line_end = f"{self.available_text.index(tk.END)}-1l"
-                self.available_text.tag_add(model["id"], line_start, line_end)
-        else:
-            for model in filtered_models:
-                self.available_text.insert(tk.END, model["id"] + "\n")
-                line_start = f"{self.available_text.index(tk.END)}-2l"
-                line_end = f"{self.available_text.index(tk.END)}-1l"
-                self.available_text.tag_add(model["id"], line_start, line_end)
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_models()
+    
+    def _schedule_display(self, event=None):
+        """Coalesce rapid skip-keyword edits into one re-display."""
+        if self._display_after_id is not None:
+            self.root.after_cancel(self._display_after_id)
+        self._display_after_id = self.root.after(150, self._apply_skip_filter)
+    
+    def _schedule_filter(self, *args):
+        """Coalesce rapid search text changes into one filter pass."""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(150, self._filter_models)
+    
+    def _filter_models(self, *args):
+        """Attach only the rows matching the search text (others are detached, not deleted)."""
+        self._filter_after_id = None
+        if not self.models_loaded or not self.available_models:
+            return
         
-        self.available_text.tag_config("header", font=("Courier", 12, "bold"))
-        self.available_text.config(state=tk.DISABLED)
+        search_text = self.search_var.get().casefold()
+        
+        if search_text:
+            # Typing more characters can only narrow the match, so rescan the last result only
+            last_text, last_matches = self._last_search
+            if last_matches is not None and last_text and search_text.startswith(last_text):
+                candidates = last_matches
+            else:
+                candidates = zip(self._model_ids, self._model_lc)
+            matches = [(model_id, model_lc) for model_id, model_lc in candidates if search_text in model_lc]
+            self._last_search = (search_text, matches)
+            ids = [model_id for model_id, _ in matches]
+        else:
+            self._last_search = ("", None)
+            ids = self._model_ids
+        self.available_tree.set_children("", *ids)
+    
+    def _sort_by_column(self, sort_type: str):
+        """Sort by a column when its heading is clicked."""
+        self.sort_by_cost_var.set(True)
+        self.sort_cost_type_var.set(sort_type)
+        self._sort_available_models()
 
     def _is_reasoning_model(self, model_id: str) -> bool:
         """Check if model supports reasoning."""
-        reasoning_patterns = ['o1', 'o3', 'deepthink', 'reasoning', 'deepseek-r1', 'qwq']
-        model_id_lower = model_id.lower()
-        return any(pattern in model_id_lower for pattern in reasoning_patterns)
+        return _is_reasoning(model_id)
 
 
 
@@ -842,19 +1094,15 @@ class OpenRouterGUI:
             sort_type = self.sort_cost_type_var.get()
             sort_label = "input price" if sort_type == "input" else "context size"
             
-            self.log_text.config(state=tk.NORMAL)
             self.logger.log(f"Sorted by {sort_label} (cached data)")
-            self.log_text.config(state=tk.DISABLED)
     
     def _is_image_model(self, model_id: str) -> bool:
         """Check if model is image generation."""
-        image_patterns = ['dalle', 'dall-e', 'stable-diffusion', 'midjourney', 'imagen',
-                         'playground', 'flux', 'sdxl', 'sd-', '/image', 'ideogram', 'recraft', 'kolors', 'pixart']
-        return any(pattern in model_id.lower() for pattern in image_patterns)
+        return _is_image(model_id)
     
     def _update_selected_count(self):
         """Update selected models count."""
-        count = len(self.selected_models)
+        count = len(self.selected_tree.get_children())
         self.selected_count_label.config(text=f"({count} selected)", foreground="#FF8C00")
         
         if count > 0:
@@ -863,46 +1111,29 @@ class OpenRouterGUI:
             self.status_label.config(text="Ready", foreground="green")
     
 
-    def _on_available_click(self, event):
-        """Handle single click to select line."""
-        try:
-            # Get clicked position
-            index = self.available_text.index(f"@{event.x},{event.y}")
-            line_num = int(index.split('.')[0])
-            
-            # Don't select header lines
-            if line_num <= 2:
-                return
-            
-            # Clear previous selection
-            self.available_text.tag_remove("sel", "1.0", tk.END)
-            
-            # Select the clicked line
-            self.available_text.tag_add("sel", f"{line_num}.0", f"{line_num}.end")
-            self.available_text.mark_set(tk.INSERT, f"{line_num}.0")
-            
-        except:
-            pass
+    def _selected_model_ids(self) -> List[str]:
+        """Return the selected model IDs in the order they were added."""
+        return list(self.selected_tree.get_children())
+    
+    def _add_selected_model(self, model_id: str) -> bool:
+        """Append a model to the selected list; returns False if it was already there."""
+        if self.selected_tree.exists(model_id):
+            return False
+        self.selected_tree.insert("", "end", iid=model_id, text=model_id)
+        return True
+    
+    def _clear_selected_tree(self):
+        """Remove every row from the selected list."""
+        rows = self.selected_tree.get_children()
+        if rows:
+            self.selected_tree.delete(*rows)
 
     def _on_available_double_click(self, event):
-        """Handle double-click to add model - extract from first column only."""
+        """Handle double-click to add the model under the pointer."""
         try:
-            index = self.available_text.index(f"@{event.x},{event.y}")
-            line = self.available_text.get(f"{index} linestart", f"{index} lineend")
-            
-            # Skip header and separator lines
-            if not line or line.startswith("Model ID") or line.startswith("-"):
-                return
-            
-            # Extract model ID from first column ONLY (before first space)
-            parts = line.split()
-            if not parts:
-                return
-            
-            model_id = parts[0].strip()  # First column only
-            
-            # Validate model ID format (should contain '/')
-            if '/' not in model_id:
+            # Headings and empty space map to no row
+            model_id = self.available_tree.identify_row(event.y)
+            if not model_id:
                 return
             
             # Check if it's an image model
@@ -911,59 +1142,34 @@ class OpenRouterGUI:
                 return
             
             # Add to selected if not already there
-            if model_id and model_id not in self.selected_models:
-                self.selected_models.append(model_id)
-                self.selected_listbox.insert(tk.END, model_id)
+            if self._add_selected_model(model_id):
                 self._update_selected_count()
                 
-                self.log_text.config(state=tk.NORMAL)
                 self.logger.log(f"Added model: {model_id}")
-                self.log_text.config(state=tk.DISABLED)
         except Exception as e:
-            self.log_text.config(state=tk.NORMAL)
             self.logger.log(f"Error adding model: {str(e)}", level="ERROR")
-            self.log_text.config(state=tk.DISABLED)
 
     def _add_models(self):
-        """Add selected models - extract from first column only."""
+        """Add the models selected in the available list."""
         try:
-            # Check if there's a selection
-            sel_ranges = self.available_text.tag_ranges(tk.SEL)
-            if not sel_ranges:
+            # Check if there's a selection (row IIDs are model IDs; ignore rows hidden by search)
+            attached = set(self.available_tree.get_children())
+            selection = [model_id for model_id in self.available_tree.selection() if model_id in attached]
+            if not selection:
                 messagebox.showinfo("Info", 
                     "Select models by:\n"
                     "• Single-click a line to select it\n"
-                    "• Shift+Click to select multiple lines\n"
+                    "• Shift/Ctrl+Click to select multiple lines\n"
                     "• Double-click to add directly\n"
                     "• Or use Ctrl+A to select all\n\n"
                     "Then click 'Add →' button")
                 return
             
-            # Get all selected text
-            start, end = sel_ranges[0], sel_ranges[1]
-            selected_text = self.available_text.get(start, end)
-            
             added_count = 0
             blocked_count = 0
             blocked_models = []
-            skipped_count = 0
             
-            for line in selected_text.split("\n"):
-                # Skip empty, header, and separator lines
-                if not line.strip() or line.startswith("Model") or line.startswith("-"):
-                    continue
-                
-                # Extract model ID from FIRST COLUMN ONLY (before first space)
-                parts = line.split()
-                if not parts:
-                    continue
-                
-                model_id = parts[0].strip()  # First column only
-                
-                # Validate model ID format (should contain '/')
-                if '/' not in model_id:
-                    skipped_count += 1
-                    continue
+            for model_id in selection:
                 
                 # Check if it's an image model
                 if self._is_image_model(model_id):
@@ -972,18 +1178,14 @@ class OpenRouterGUI:
                     continue
                 
                 # Add to selected
-                if model_id and model_id not in self.selected_models:
-                    self.selected_models.append(model_id)
-                    self.selected_listbox.insert(tk.END, model_id)
+                if self._add_selected_model(model_id):
                     added_count += 1
             
             self._update_selected_count()
             
             # Show results
             if added_count > 0:
-                self.log_text.config(state=tk.NORMAL)
                 self.logger.log(f"Added {added_count} model(s)")
-                self.log_text.config(state=tk.DISABLED)
             
             if blocked_count > 0:
                 model_list = "\n".join([f"- {m}" for m in blocked_models[:5]])
@@ -1004,25 +1206,23 @@ class OpenRouterGUI:
 
     def _remove_models(self):
         """Remove selected models."""
-        selection = self.selected_listbox.curselection()
-        for idx in reversed(selection):
-            model_id = self.selected_listbox.get(idx)
-            self.selected_models.remove(model_id)
-            self.selected_listbox.delete(idx)
+        selection = self.selected_tree.selection()
+        if not selection:
+            return
         
+        # Rows are keyed by model ID, so the selection deletes directly
+        self.selected_tree.delete(*selection)
         self._update_selected_count()
     
     def _clear_selected(self):
         """Clear all selected models."""
-        self.selected_models.clear()
-        self.selected_listbox.delete(0, tk.END)
+        self._clear_selected_tree()
         self._update_selected_count()
     
     def _clear_logs(self):
         """Clear logs."""
-        self.log_text.config(state=tk.NORMAL)
         self.log_text.delete("1.0", tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        self._log_lines = 0
     
     def _run_models(self):
         """Run chat requests."""
@@ -1030,7 +1230,8 @@ class OpenRouterGUI:
             messagebox.showerror("Validation Error", "API key is required")
             return
         
-        if not self.selected_models:
+        models = self._selected_model_ids()
+        if not models:
             messagebox.showerror("Validation Error", "Please select at least one model")
             return
         
@@ -1039,150 +1240,205 @@ class OpenRouterGUI:
             messagebox.showerror("Validation Error", "User prompt is required")
             return
         
-        thread = threading.Thread(target=self._execute_models, daemon=True)
-        thread.start()
-    
-    def _execute_models(self):
-        """Execute chat requests on selected models."""
+        # Snapshot every Tk value once, here on the main thread; workers never touch Tk
         try:
-            self.run_btn.config(state=tk.DISABLED)
-            self.status_label.config(text="Running...", foreground="orange")
-            
             self._init_client()
-            
             system_prompt = self.system_prompt.get("1.0", tk.END).strip()
-            user_prompt = self.user_prompt.get("1.0", tk.END).strip()
-            temperature = self.temp_var.get()
-            top_p = self.top_p_var.get()
-            top_k = self.top_k_var.get()
-            max_tokens = self.max_tokens_var.get()
-            
-            self.execution_results = []
-            
-            self.log_text.config(state=tk.NORMAL)
-            
+            params = {
+                "temperature": self.temp_var.get(),
+                "top_p": self.top_p_var.get(),
+                "top_k": self.top_k_var.get(),
+                "max_tokens": self.max_tokens_var.get(),
+                "enable_reasoning": self.enable_reasoning_var.get()
+            }
+            max_workers = max(1, self.max_workers_var.get())
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Validation Error", f"Invalid parameter: {str(e)}")
+            return
+        
+        self.run_btn.config(state=tk.DISABLED)
+        self.status_label.config(text="Running...", foreground="orange")
+        
+        thread = threading.Thread(
+            target=self._execute_models,
+            args=(self.client, models, system_prompt, user_prompt, params, max_workers),
+            daemon=True
+        )
+        thread.start()
+    
+    def _execute_models(self, client, models: List[str], system_prompt: str, user_prompt: str,
+                        params: dict, max_workers: int):
+        """Execute chat requests on selected models concurrently (runs on a worker thread).
+        
+        Takes a snapshot of the GUI inputs; all widget and logger updates are
+        posted with _post() and run on the Tk main thread by _drain_logs().
+        """
+        try:
             try:
-                key_info = self.client.get_key_info()
-                self.logger.log_key_balance(key_info)
-            except:
-                self.logger.log("Could not fetch initial balance", level="WARNING")
-            
-            self.logger.separator("=", 80)
-            self.logger.log(f"Starting execution on {len(self.selected_models)} models")
-            self.logger.log(f"Parameters: temp={temperature}, top_p={top_p}, top_k={top_k}, max_tokens={max_tokens}")
-            self.logger.log_prompts(system_prompt, user_prompt)
-            self.logger.separator("=", 80)
-            self.log_text.config(state=tk.DISABLED)
-            
-            # Execute on each model
-            for model_id in self.selected_models:
-                start_time = time.time()
-                
-                try:
-                    self.log_text.config(state=tk.NORMAL)
-                    self.logger.model_header(model_id)
-                    self.logger.log("Sending request...")
-                    
-                    response, usage = self.client.chat(
-                        model_id=model_id,
-                        system_prompt=system_prompt,
-                        user_prompt=user_prompt,
-                        temperature=temperature,
-                        top_p=top_p,
-                        top_k=top_k,
-                        max_tokens=max_tokens,
-                        enable_reasoning=self.enable_reasoning_var.get() 
-                    )
-                    
-                    execution_time = time.time() - start_time
-                    
-                    cost_details = usage.get("cost_details", {})
-                    self.model_costs[model_id] = {
-                        "input_cost": float(cost_details.get("upstream_inference_prompt_cost", 0)),
-                        "output_cost": float(cost_details.get("upstream_inference_completions_cost", 0))
-                    }
-                    
-                    cost_usd = Decimal(str(usage.get("cost", 0)))
-                    
-                    # Check if context window was exceeded (cost but no/empty response)
-                    if cost_usd > 0 and (not response or len(response.strip()) < 10):
-                        self.logger.log("⚠️  WARNING: Cost incurred but response is empty/incomplete!", level="WARNING")
-                        self.logger.log("⚠️  Possible cause: Context window exceeded or max_tokens too low", level="WARNING")
-                        
-                        # Get model context window
-                        for model in self.available_models:
-                            if model["id"] == model_id:
-                                ctx_window = model.get("context_length", 0)
-                                prompt_tokens = usage.get("prompt_tokens", 0)
-                                self.logger.log(f"   Model context: {ctx_window:,} tokens | Your prompt used: {prompt_tokens:,} tokens", level="WARNING")
-                                self.logger.log(f"   Suggestion: Reduce prompt length or increase max_tokens (current: {max_tokens})", level="WARNING")
-                                break
-                    
-                    self.execution_results.append({
-                        "model": model_id,
-                        "total_tokens": usage.get("total_tokens", 0),
-                        "prompt_tokens": usage.get("prompt_tokens", 0),
-                        "completion_tokens": usage.get("completion_tokens", 0),
-                        "cost_usd": cost_usd,
-                        "input_cost_usd": Decimal(str(cost_details.get("upstream_inference_prompt_cost", 0))),
-                        "output_cost_usd": Decimal(str(cost_details.get("upstream_inference_completions_cost", 0))),
-                        "execution_time": execution_time
-                    })
-                    
-                    self.logger.log_usage(usage, execution_time)
-                    self.logger.separator("-", 80)
-                    self.logger.log("Response:")
-                    self.logger.log(response if response else "(Empty response)")
-                    self.logger.separator("-", 80)
-                    self.log_text.config(state=tk.DISABLED)
-                    
-                except Exception as e:
-                    execution_time = time.time() - start_time
-                    self.log_text.config(state=tk.NORMAL)
-                    self.logger.log(f"ERROR: {str(e)} (took {execution_time:.2f}s)", level="ERROR")
-                    
-                    # Store failed execution
-                    self.execution_results.append({
-                        "model": f"{model_id} (FAILED)",
-                        "total_tokens": 0,
-                        "prompt_tokens": 0,
-                        "completion_tokens": 0,
-                        "cost_usd": Decimal("0"),
-                        "input_cost_usd": Decimal("0"),
-                        "output_cost_usd": Decimal("0"),
-                        "execution_time": execution_time
-                    })
-                    
-                    self.logger.separator("-", 80)
-                    self.log_text.config(state=tk.DISABLED)
-            
-            self.log_text.config(state=tk.NORMAL)
-            
-            total_cost = sum(r.get("cost_usd", Decimal("0")) for r in self.execution_results)
-            
-            self.logger.separator("=", 80)
-            self.logger.log(f"Total Cost: ${total_cost:.7f} USD")
-            self.logger.log(f"Total Cost: ₹{(total_cost * Decimal(str(self.usd_to_inr))):.4f} INR")
-            
-            self.logger.log_detailed_summary_table(self.execution_results, self.usd_to_inr)
-            
-            self.logger.separator("=", 80)
-            self.logger.log("Execution completed")
-            self.logger.log("Tip: Use 'Check Key Balance' to verify")
-            self.logger.separator("=", 80)
-            self.log_text.config(state=tk.DISABLED)
+                key_info = client.get_key_info()
+            except Exception:
+                key_info = None
+            
+            self._post(self._log_execution_start, models, system_prompt, user_prompt, params, key_info)
+            
+            def on_result(index: int, outcome, execution_time: float):
+                if self._stop_event.is_set():
+                    return  # Window closed; nothing left to update
+                self._post(self._record_model_result,
+                           *self._collect_result(models[index], outcome, execution_time),
+                           params["max_tokens"])
+            
+            # Requests are I/O-bound, so the pool overlaps the network waits. The pool
+            # is kept on self so _on_close can cancel jobs that have not started.
+            jobs = [dict(model_id=model_id, system_prompt=system_prompt, user_prompt=user_prompt, **params)
+                    for model_id in models]
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(models), client.max_connections)))
+            try:
+                client.chat_many(jobs, on_result=on_result, executor=self._executor,
+                                 stop_event=self._stop_event)
+            finally:
+                self._executor.shutdown(wait=False)
+                self._executor = None
             
-            self.status_label.config(text="Completed", foreground="green")
+            self._post(self._finish_execution)
             
         except Exception as e:
-            self.log_text.config(state=tk.NORMAL)
-            self.logger.log(f"FATAL ERROR: {str(e)}", level="ERROR")
-            self.log_text.config(state=tk.DISABLED)
-            self.status_label.config(text="Error", foreground="red")
-            messagebox.showerror("Execution Error", str(e))
+            self._post(self._on_execution_error, e)
         
         finally:
-            self.run_btn.config(state=tk.NORMAL)
+            self._post(lambda: self.run_btn.config(state=tk.NORMAL))
+    
+    def _collect_result(self, model_id: str, outcome, execution_time: float):
+        """Unpack one chat_many() outcome (runs on the run thread).
+        
+        Returns (model_id, response, usage, execution_time, error, result), where
+        result is the execution_results entry, built here to keep the Tk thread free.
+        """
+        try:
+            if isinstance(outcome, Exception):
+                raise outcome
+            response, usage = outcome
+            usage = usage or {}  # The API may send "usage": null
+            error = None
+            result = self._build_result(model_id, usage, execution_time, error)
+        except Exception as e:
+            # Malformed usage is treated like a failed request: this model is marked FAILED
+            response, usage, error = None, None, e
+            result = self._build_result(model_id, usage, execution_time, error)
+        return model_id, response, usage, execution_time, error, result
+    
+    @staticmethod
+    def _build_result(model_id: str, usage, execution_time: float, error) -> dict:
+        """Build the execution_results entry for one request; failed runs record zero cost."""
+        if error is not None:
+            # Store failed execution
+            return {
+                "model": f"{model_id} (FAILED)",
+                "total_tokens": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "cost_usd": DEC_ZERO,
+                "input_cost_usd": DEC_ZERO,
+                "output_cost_usd": DEC_ZERO,
+                "execution_time": execution_time
+            }
+        
+        cost_details = usage.get("cost_details") or {}
+        return {
+            "model": model_id,
+            "total_tokens": usage.get("total_tokens") or 0,
+            "prompt_tokens": usage.get("prompt_tokens") or 0,
+            "completion_tokens": usage.get("completion_tokens") or 0,
+            "cost_usd": _to_dec(usage.get("cost", 0)),
+            "input_cost_usd": _to_dec(cost_details.get("upstream_inference_prompt_cost", 0)),
+            "output_cost_usd": _to_dec(cost_details.get("upstream_inference_completions_cost", 0)),
+            "execution_time": execution_time
+        }
+    
+    def _log_execution_start(self, models: List[str], system_prompt: str, user_prompt: str,
+                             params: dict, key_info):
+        """Log the run header and reset results (main thread)."""
+        self.execution_results = []
+        self._run_total = len(models)
+        self._total_cost = DEC_ZERO
+        
+        
+        if key_info is not None:
+            self.logger.log_key_balance(key_info)
+        else:
+            self.logger.log("Could not fetch initial balance", level="WARNING")
+        
+        self.logger.separator("=", 80)
+        self.logger.log(f"Starting execution on {len(models)} models")
+        self.logger.log(f"Parameters: temp={params['temperature']}, top_p={params['top_p']}, top_k={params['top_k']}, max_tokens={params['max_tokens']}")
+        self.logger.log_prompts(system_prompt, user_prompt)
+        self.logger.separator("=", 80)
+    
+    def _record_model_result(self, model_id: str, response, usage, execution_time: float,
+                             error, result: dict, max_tokens: int):
+        """Store and log one finished model request (main thread, in completion order)."""
+        self.execution_results.append(result)
+        self.status_label.config(text=f"Running... ({len(self.execution_results)}/{self._run_total})",
+                                 foreground="orange")
+        
+        self.logger.model_header(model_id)
+        
+        if error is not None:
+            self.logger.log(f"ERROR: {error} (took {execution_time:.2f}s)", level="ERROR")
+            self.logger.separator("-", 80)
+            return
+        
+        # Reuse the costs _build_result already parsed; it maps null fields to zero
+        self.model_costs[model_id] = {
+            "input_cost": float(result["input_cost_usd"]),
+            "output_cost": float(result["output_cost_usd"])
+        }
+        
+        cost_usd = result["cost_usd"]
+        self._total_cost += cost_usd
+        
+        # Check if context window was exceeded (cost but no/empty response)
+        if cost_usd > 0 and (not response or len(response.strip()) < 10):
+            self.logger.log("⚠️  WARNING: Cost incurred but response is empty/incomplete!", level="WARNING")
+            self.logger.log("⚠️  Possible cause: Context window exceeded or max_tokens too low", level="WARNING")
+            
+            # Get model context window
+            model = self.model_by_id.get(model_id)
+            if model is not None:
+                ctx_window = model.get("context_length") or 0
+                prompt_tokens = result["prompt_tokens"]
+                self.logger.log(f"   Model context: {ctx_window:,} tokens | Your prompt used: {prompt_tokens:,} tokens", level="WARNING")
+                self.logger.log(f"   Suggestion: Reduce prompt length or increase max_tokens (current: {max_tokens})", level="WARNING")
+        
+        self.logger.log_usage(usage, execution_time)
+        self.logger.separator("-", 80)
+        self.logger.log("Response:")
+        self.logger.log(response if response else "(Empty response)")
+        self.logger.separator("-", 80)
+    
+    def _finish_execution(self):
+        """Log run totals and the summary table (main thread)."""
+        total_cost = self._total_cost
+        
+        self.logger.separator("=", 80)
+        self.logger.log(f"Total Cost: ${total_cost:.7f} USD")
+        self.logger.log(f"Total Cost: ₹{(total_cost * _to_dec(self.usd_to_inr)):.4f} INR")
+        
+        self.logger.log_detailed_summary_table(self.execution_results, self.usd_to_inr)
+        
+        self.logger.separator("=", 80)
+        self.logger.log("Execution completed")
+        self.logger.log("Tip: Use 'Check Key Balance' to verify")
+        self.logger.separator("=", 80)
+        
+        self.status_label.config(text="Completed", foreground="green")
+    
+    def _on_execution_error(self, error: Exception):
+        """Report a run-level failure (main thread)."""
+        self.logger.log(f"FATAL ERROR: {error}", level="ERROR")
+        self.status_label.config(text="Error", foreground="red")
+        messagebox.showerror("Execution Error", str(error))
 
 
 def main():
@@ -1,52 +1,193 @@
+import atexit
+import io
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
+import time
+from collections import deque
 from typing import Optional
 import tkinter as tk
 from decimal import Decimal
+from functools import lru_cache
+
+LOG_BUFFER_SIZE = 64 * 1024  # Bytes of log text held in memory before a write
+LOG_FLUSH_RECORDS = 100  # File records batched before they are pushed to disk
+LOGGER_NAME = 'OpenRouterTester'
+
+# Set by _configure_file_logging() once the shared logger has its file pipeline
+_log_file_in_use: Optional[str] = None
+
+# log() level names; anything else is logged as INFO
+_LEVELS = {"ERROR": logging.ERROR, "WARNING": logging.WARNING}
+
+# Decimal constants used by the cost reports, built once
+DEC_ZERO = Decimal("0")
+PAISA_PER_INR = Decimal(100)
+INR_PER_USD = Decimal("90")  # Fixed rate used by the per-request usage lines
+
+# Column layout of the detailed summary table, parsed once instead of per row
+SUMMARY_HEADER_FMT = "{:<45} {:<10} {:<10} {:<10} {:<12} {:<12} {:<12} {:<14} {:<10}"
+SUMMARY_ROW_FMT = "{:<45} {:<10} {:<10} {:<10} ${:<11.7f} ${:<11.7f} ${:<11.7f} ₹{:<13.4f} {:<10.2f}"
+
+
+# (epoch second, formatted timestamp) of the last log line; replaced as one tuple
+_timestamp_cache = (0, "")
+
+
+def _timestamp() -> str:
+    """Return the local time as 'YYYY-MM-DD HH:MM:SS', formatting at most once per second."""
+    global _timestamp_cache
+    now = int(time.time())
+    cached_second, text = _timestamp_cache
+    if now != cached_second:
+        text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        _timestamp_cache = (now, text)
+    return text
+
+
+@lru_cache(maxsize=16)
+def _separator_line(char: str, length: int) -> str:
+    """Return char repeated length times; only a handful of shapes are ever used."""
+    return char * length
+
+
+class _BufferedFileHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to its buffered stream.
+    
+    StreamHandler.emit() flushes after every record, which turns each log line
+    into a write syscall; here the file's own buffer decides when to write.
+    """
+    
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes its target's stream when it empties the buffer.
+    
+    Without this a flushed batch (or an ERROR record) would still sit in the
+    file's own buffer instead of reaching disk.
+    """
+    
+    def flush(self):
+        super().flush()
+        with self.lock:
+            if self.target:
+                self.target.flush()
+
+
+def _configure_file_logging(log_file: str) -> str:
+    """
+    Attach the file pipeline to the OpenRouterTester logger, once per process.
+    Records go only to this logger's own handlers, never through the root logger.
+    Returns: Path of the file the logger writes to
+    """
+    global _log_file_in_use
+    if _log_file_in_use is not None:
+        return _log_file_in_use
+    
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    
+    # log() enqueues records and a listener thread batches them in memory,
+    # writing every LOG_FLUSH_RECORDS records or on ERROR
+    stream = open(log_file, 'a', buffering=LOG_BUFFER_SIZE, encoding='utf-8')
+    handler = _BufferedFileHandler(stream)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s', '%Y-%m-%d %H:%M:%S'))
+    
+    batch = _FlushingMemoryHandler(LOG_FLUSH_RECORDS, flushLevel=logging.ERROR,
+                                   target=handler, flushOnClose=True)
+    
+    records = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, batch, respect_handler_level=True)
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    listener.start()
+    
+    # atexit runs in reverse: drain the queue first, then write out the batch
+    atexit.register(batch.flush)
+    atexit.register(listener.stop)
+    
+    _log_file_in_use = log_file
+    return log_file
+
 
 class DualLogger:
-    """Logger that writes to both file and GUI text widget."""
+    """Logger that writes to both file and GUI text widget.
+    
+    GUI lines are queued and only written by flush(), which the owner of the
+    widget calls from the Tk main thread; log() itself is safe from any thread.
+    File records are handed to a background listener thread, so log() never
+    waits on disk I/O.
+    """
+    
+    _TK_END = tk.END  # Bound once; flush() would otherwise look it up on the module
     
     def __init__(self, log_file: str = None, text_widget: Optional[tk.Text] = None):
         self.text_widget = text_widget
+        self._pending = deque()
         
         # Generate log filename if not provided
         if log_file is None:
-            log_file = f"{datetime.now().strftime('%Y%m%d')}-openrouter-log.txt"
+            log_file = f"{time.strftime('%Y%m%d')}-openrouter-log.txt"
         
-        self.log_file = log_file
+        # The file the shared logger actually writes to, which may predate this instance
+        self.log_file = _configure_file_logging(log_file)
+        self.logger = logging.getLogger(LOGGER_NAME)
         
-        # Configure file logging
-        logging.basicConfig(
-            filename=self.log_file,
-            level=logging.INFO,
-            format='%(asctime)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        self.logger = logging.getLogger('OpenRouterTester')
+        # Without a widget every call is file-only: specialize log() for that shape
+        if text_widget is None:
+            self._log_info = self.logger.info
+            self.log = self._log_file_only
+    
+    def _log_file_only(self, message: str, level: str = "INFO"):
+        """log() for loggers created without a text widget."""
+        if level == "INFO":
+            self._log_info(message)
+        else:
+            self.logger.log(_LEVELS.get(level, logging.INFO), message)
     
     def log(self, message: str, level: str = "INFO"):
         """Write message to both file and GUI."""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        formatted_message = f"[{timestamp}] {message}"
-        
-        # Log to file
-        if level == "ERROR":
-            self.logger.error(message)
-        elif level == "WARNING":
-            self.logger.warning(message)
-        else:
-            self.logger.info(message)
+        # Log to file; the file formatter adds its own timestamp
+        self.logger.log(_LEVELS.get(level, logging.INFO), message)
         
-        # Log to GUI if widget available
+        # Queue for the GUI if widget available; only then is the prefixed line needed
         if self.text_widget:
-            self.text_widget.insert(tk.END, formatted_message + "\n")
-            self.text_widget.see(tk.END)
-            self.text_widget.update_idletasks()
+            self._pending.append(f"[{_timestamp()}] {message}")
+    
+    def has_pending(self) -> bool:
+        """Return True if GUI lines are waiting for flush()."""
+        return bool(self._pending)
+    
+    def flush(self):
+        """
+        Write all queued lines to the text widget in one insert (Tk main thread only).
+        Returns: Number of text lines added to the widget
+        """
+        pending = self._pending
+        lines = []
+        while pending:
+            lines.append(pending.popleft())
+        widget = self.text_widget
+        if not (lines and widget):
+            return 0
+        
+        text = "\n".join(lines) + "\n"
+        widget.insert(self._TK_END, text)
+        widget.see(self._TK_END)
+        return text.count("\n")
+    
+    def _info_enabled(self) -> bool:
+        """Return True if INFO lines reach the file or the GUI."""
+        return self.text_widget is not None or self.logger.isEnabledFor(logging.INFO)
     
     def separator(self, char: str = "=", length: int = 80):
         """Add a visual separator line."""
-        self.log(char * length)
+        self.log(_separator_line(char, length))
     
     def model_header(self, model_id: str):
         """Log a model execution header."""
@@ -56,6 +197,9 @@ class DualLogger:
     
     def log_key_balance(self, key_info: dict):
         """Log API key balance and limits with percentage."""
+        if not self._info_enabled():
+            return
+        
         try:
             limit = key_info.get("limit", 0)
             usage = key_info.get("usage", 0)
@@ -77,24 +221,34 @@ class DualLogger:
 
     def log_detailed_summary_table(self, execution_results: list, usd_to_inr: float = 83.5):
         """Log detailed summary table with paisa column."""
+        if not self._info_enabled():
+            return
+        
         if not execution_results:
             self.log("No execution results to summarize")
             return
         
-        self.separator("=", 130)
-        self.log("DETAILED EXECUTION SUMMARY")
-        self.separator("=", 130)
+        # Build the whole report first, then log it as one entry: one file record
+        # and one GUI line, with the timestamp on the first row only
+        buf = io.StringIO()
+        
+        def emit(line: str):
+            buf.write(line)
+            buf.write("\n")
         
-        header = f"{'Model':<45} {'In Tok':<10} {'Out Tok':<10} {'Total':<10} {'Cost In':<12} {'Cost Out':<12} {'Total USD':<12} {'Total INR':<14} {'Paisa':<10}"
-        self.log(header)
-        self.separator("-", 130)
+        emit(_separator_line("=", 130))
+        emit("DETAILED EXECUTION SUMMARY")
+        emit(_separator_line("=", 130))
         
-        total_prompt_tokens = 0
-        total_completion_tokens = 0
-        total_tokens = 0
-        total_cost_usd = Decimal("0")
-        total_input_cost = Decimal("0")
-        total_output_cost = Decimal("0")
+        header = SUMMARY_HEADER_FMT.format("Model", "In Tok", "Out Tok", "Total", "Cost In",
+                                           "Cost Out", "Total USD", "Total INR", "Paisa")
+        emit(header)
+        emit(_separator_line("-", 130))
+        
+        # Convert the exchange rate once; Decimal(str(...)) is the slow constructor path
+        rate = Decimal(str(usd_to_inr))
+        paisa_rate = rate * PAISA_PER_INR
+        row_fmt = SUMMARY_ROW_FMT.format
         
         for result in execution_results:
             model_name = result.get("model", "Unknown")[:43]
@@ -102,42 +256,45 @@ class DualLogger:
             completion_tokens = result.get("completion_tokens", 0)
             tokens = result.get("total_tokens", 0)
             
-            input_cost = result.get("input_cost_usd", Decimal("0"))
-            output_cost = result.get("output_cost_usd", Decimal("0"))
-            cost_usd = result.get("cost_usd", Decimal("0"))
-            cost_inr = cost_usd * Decimal(str(usd_to_inr))
-            cost_paisa = cost_inr * 100  # 1 INR = 100 paisa
-            
-            total_prompt_tokens += prompt_tokens
-            total_completion_tokens += completion_tokens
-            total_tokens += tokens
-            total_cost_usd += cost_usd
-            total_input_cost += input_cost
-            total_output_cost += output_cost
-            
-            row = f"{model_name:<45} {prompt_tokens:<10} {completion_tokens:<10} {tokens:<10} ${input_cost:<11.7f} ${output_cost:<11.7f} ${cost_usd:<11.7f} ₹{cost_inr:<13.4f} {cost_paisa:<10.2f}"
-            self.log(row)
+            # Rows are display-only: format floats, which is much cheaper than
+            # Decimal.__format__; the totals below are still summed as Decimal
+            cost_usd = result.get("cost_usd", DEC_ZERO)
+            emit(row_fmt(model_name, prompt_tokens, completion_tokens, tokens,
+                         float(result.get("input_cost_usd", DEC_ZERO)),
+                         float(result.get("output_cost_usd", DEC_ZERO)),
+                         float(cost_usd), float(cost_usd * rate), float(cost_usd * paisa_rate)))
         
-        self.separator("-", 130)
-        total_cost_inr = total_cost_usd * Decimal(str(usd_to_inr))
-        total_paisa = total_cost_inr * 100
-        total_row = f"{'TOTAL':<45} {total_prompt_tokens:<10} {total_completion_tokens:<10} {total_tokens:<10} ${total_input_cost:<11.7f} ${total_output_cost:<11.7f} ${total_cost_usd:<11.7f} ₹{total_cost_inr:<13.4f} {total_paisa:<10.2f}"
-        self.log(total_row)
-        self.separator("=", 130)
+        emit(_separator_line("-", 130))
+        
+        # Column totals: builtin sum() runs the additions in C instead of += per row
+        total_prompt_tokens = sum(r.get("prompt_tokens", 0) for r in execution_results)
+        total_completion_tokens = sum(r.get("completion_tokens", 0) for r in execution_results)
+        total_tokens = sum(r.get("total_tokens", 0) for r in execution_results)
+        total_input_cost = sum((r.get("input_cost_usd", DEC_ZERO) for r in execution_results), DEC_ZERO)
+        total_output_cost = sum((r.get("output_cost_usd", DEC_ZERO) for r in execution_results), DEC_ZERO)
+        total_cost_usd = sum((r.get("cost_usd", DEC_ZERO) for r in execution_results), DEC_ZERO)
+        
+        total_cost_inr = total_cost_usd * rate
+        total_paisa = total_cost_usd * paisa_rate
+        emit(row_fmt("TOTAL", total_prompt_tokens, total_completion_tokens, total_tokens,
+                     total_input_cost, total_output_cost, total_cost_usd, total_cost_inr, total_paisa))
+        emit(_separator_line("=", 130))
         
         if len(execution_results) > 0:
             avg_cost_usd = total_cost_usd / len(execution_results)
-            avg_cost_inr = avg_cost_usd * Decimal(str(usd_to_inr))
-            avg_paisa = avg_cost_inr * 100
+            avg_cost_inr = avg_cost_usd * rate
+            avg_paisa = avg_cost_usd * paisa_rate
             avg_tokens = total_tokens // len(execution_results)
             
-            self.log(f"Models Executed: {len(execution_results)}")
-            self.log(f"Total Cost: ${total_cost_usd:.7f} USD (₹{total_cost_inr:.4f} INR / {total_paisa:.2f} paisa)")
-            self.log(f"Average Cost: ${avg_cost_usd:.7f} USD (₹{avg_cost_inr:.4f} INR / {avg_paisa:.2f} paisa)")
-            self.log(f"Average Tokens: {avg_tokens}")
-            self.log(f"Exchange Rate: 1 USD = {usd_to_inr} INR = {usd_to_inr * 100:.0f} paisa")
+            emit(f"Models Executed: {len(execution_results)}")
+            emit(f"Total Cost: ${total_cost_usd:.7f} USD (₹{total_cost_inr:.4f} INR / {total_paisa:.2f} paisa)")
+            emit(f"Average Cost: ${avg_cost_usd:.7f} USD (₹{avg_cost_inr:.4f} INR / {avg_paisa:.2f} paisa)")
+            emit(f"Average Tokens: {avg_tokens}")
+            emit(f"Exchange Rate: 1 USD = {usd_to_inr} INR = {paisa_rate:.0f} paisa")
+        
+        emit(_separator_line("=", 130))
         
-        self.separator("=", 130)
+        self.log(buf.getvalue().rstrip("\n"))
 
 
 
@@ -145,6 +302,9 @@ class DualLogger:
 
     def log_usage(self, usage: dict, execution_time: float = 0):
         """Log detailed usage and cost information with execution time."""
+        if not self._info_enabled():
+            return
+        
         try:
             # Extract cost details
             total_cost = usage.get("cost", 0)
@@ -169,7 +329,7 @@ class DualLogger:
             # Log cost breakdown
             if total_cost > 0:
                 total_cost_decimal = Decimal(str(total_cost))
-                total_cost_inr = total_cost_decimal * Decimal("90")
+                total_cost_inr = total_cost_decimal * INR_PER_USD
                 self.log(f"Total Cost: ${total_cost_decimal:.7f} (₹{total_cost_inr:.4f} INR)")
 
                 # Cost as percentage of 1 cent
@@ -186,7 +346,7 @@ class DualLogger:
                 
                 # Calculate requests per $1 & per 1.00 INR
                 requests_per_dollar = Decimal("1.0") / total_cost_decimal
-                requests_per_inr = requests_per_dollar / Decimal("90")
+                requests_per_inr = requests_per_dollar / INR_PER_USD
                 self.log(f"Cost Efficiency: ~{requests_per_dollar:.0f} req/$1.00 (~{requests_per_inr:.0f} req/₹1.00)")
                                 
 
@@ -202,23 +362,24 @@ class DualLogger:
             self.log(f"Error logging usage: {str(e)}", level="WARNING")
 
     
+    @staticmethod
+    def _indent_lines(text: str) -> str:
+        """Indent every line of text by two spaces."""
+        return "\n".join(f"  {line}" for line in text.strip().splitlines())
+    
     def log_prompts(self, system_prompt: str, user_prompt: str):
         """Log the system and user prompts used for the request."""
         self.separator("-", 80)
         self.log("PROMPTS USED:")
         self.separator("-", 80)
         
+        # Each prompt is one multi-line entry, indented line by line for readability
         if system_prompt and system_prompt.strip():
-            self.log("System Prompt:")
-            # Split into lines for better readability in logs
-            for line in system_prompt.strip().split('\n'):
-                self.log(f"  {line}")
+            self.log("System Prompt:\n" + self._indent_lines(system_prompt))
         else:
             self.log("System Prompt: (none)")
         
         self.log("")  # Empty line for separation
-        self.log("User Prompt:")
-        for line in user_prompt.strip().split('\n'):
-            self.log(f"  {line}")
+        self.log("User Prompt:\n" + self._indent_lines(user_prompt))
         
         self.separator("-", 80)